@@ -140,6 +140,26 @@ class AwkwardTokenizable:
         return self.ret_val
 
 
+class _InputDepDict(BlockwiseDepDict):
+    """Input dependency of an :class:`AwkwardInputLayer`.
+
+    Dask tokenizes a ``BlockwiseDepDict`` by pickling its whole
+    mapping, which costs time proportional to the number of
+    partitions. The name of the input layer is already a token of its
+    inputs, so we use that instead.
+
+    """
+
+    def __init__(self, name: str, mapping: Mapping, produces_tasks: bool) -> None:
+        # the mapping is only indexed, so a lazy Mapping stands in for
+        # the dict that BlockwiseDepDict is annotated with.
+        super().__init__(mapping=cast(dict, mapping), produces_tasks=produces_tasks)
+        self.name = name
+
+    def __dask_tokenize__(self):
+        return ("_InputDepDict", self.name, self.produces_tasks, len(self))
+
+
 class AwkwardInputLayer(AwkwardBlockwiseLayer):
     """A layer known to perform IO and produce Awkward arrays
 
@@ -165,8 +185,9 @@ class AwkwardInputLayer(AwkwardBlockwiseLayer):
         self.annotations = annotations
         self.creation_info = creation_info
 
-        io_arg_map = BlockwiseDepDict(
-            mapping=LazyInputsDict(self.inputs),  # type: ignore
+        io_arg_map = _InputDepDict(
+            name,
+            mapping=LazyInputsDict(self.inputs),
             produces_tasks=self.produces_tasks,
         )
 
@@ -27,6 +27,7 @@ from dask_awkward.lib.io.io import (
 from dask_awkward.lib.io.json import from_json, to_json
 from dask_awkward.lib.io.parquet import from_parquet, to_parquet
 from dask_awkward.lib.io.text import from_text
+from dask_awkward.lib.numba import map_partitions_numba
 from dask_awkward.lib.operations import concatenate
 from dask_awkward.lib.reducers import (
     all,
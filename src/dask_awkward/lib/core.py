@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import bisect
+import builtins
 import keyword
 import logging
 import math
@@ -9,7 +11,7 @@ import sys
 import warnings
 from collections.abc import Callable, Hashable, Mapping, Sequence
 from enum import IntEnum
-from functools import cached_property, partial, wraps
+from functools import lru_cache, partial, wraps
 from inspect import getattr_static
 from numbers import Number
 from types import MappingProxyType
@@ -48,6 +50,7 @@ from dask.utils import funcname, is_arraylike, key_split
 from dask_awkward.layers import (
     AwkwardBlockwiseLayer,
     AwkwardMaterializedLayer,
+    AwkwardTreeReductionLayer,
     _dask_uses_tasks,
 )
 from dask_awkward.lib.optimize import all_optimizations
@@ -77,6 +80,9 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+# types.EllipsisType is only available from Python 3.10.
+_EllipsisType = type(Ellipsis)
+
 
 log = logging.getLogger(__name__)
 
@@ -327,6 +333,14 @@ def dask_method(maybe_func=None, *, no_dispatch=False):
         return dask_method_wrapper(maybe_func)
 
 
+@lru_cache(maxsize=256)
+def _attribute_fields(fields: tuple[str, ...]) -> tuple[str, ...]:
+    """Fields that are valid attribute names (listed by ``dir``)."""
+    return tuple(
+        x for x in fields if _dir_pattern.match(x) and not keyword.iskeyword(x)
+    )
+
+
 class Scalar(DaskMethodsMixin, DaskOperatorMethodMixin):
     """Single partition Dask collection representing a lazy Scalar.
 
@@ -504,7 +518,7 @@ class Scalar(DaskMethodsMixin, DaskOperatorMethodMixin):
     @classmethod
     def _get_binary_operator(cls, op, inv=False):
         def f(self, other):
-            name = f"{op.__name__}-{tokenize(self, other)}"
+            name = f"{op.__name__}-{tokenize(self.name, other)}"
             deps = [self]
             plns = [self.name]
             if is_dask_collection(other):
@@ -547,7 +561,7 @@ class Scalar(DaskMethodsMixin, DaskOperatorMethodMixin):
     @classmethod
     def _get_unary_operator(cls, op, inv=False):
         def f(self):
-            name = f"{op.__name__}-{tokenize(self)}"
+            name = f"{op.__name__}-{tokenize(self.name)}"
             layer = AwkwardMaterializedLayer(
                 {(name, 0): (op, self.key)},
                 previous_layer_names=[self.name],
@@ -733,7 +747,7 @@ class Record(Scalar):
         return m
 
     def __getitem__(self, where):
-        token = tokenize(self, where)
+        token = tokenize(self.name, where)
         new_name = f"{where}-{token}"
         new_meta = self._meta[where]
 
@@ -789,16 +803,12 @@ class Record(Scalar):
         return []
 
     def __dir__(self) -> list[str]:
-        fields = [] if self._meta is None else self._meta._layout.fields
+        fields = () if self._meta is None else tuple(self._meta._layout.fields)
         return sorted(
             set(
                 [x for x in dir(type(self)) if not x.startswith("_")]
                 + dir(super())
-                + [
-                    x
-                    for x in fields
-                    if _dir_pattern.match(x) and not keyword.iskeyword(x)
-                ]
+                + list(_attribute_fields(fields))
             )
         )
 
@@ -840,33 +850,67 @@ def _is_numpy_or_cupy_like(arr: Any) -> bool:
     )
 
 
+def _without_redundant_empty_arrays(results: Sequence[Any]) -> Sequence[Any]:
+    # awkward pays a handful of kernel calls per array when merging,
+    # even for empty ones; empty partitions with the same form as a
+    # non-empty one cannot change the concatenated type, so skip them.
+    form = next(
+        (r.layout.form for r in results if isinstance(r, ak.Array) and len(r)), None
+    )
+    if form is None:
+        return results
+    return [
+        r
+        for r in results
+        if not (
+            isinstance(r, ak.Array)
+            and len(r) == 0
+            and r.layout.form.is_equal_to(form, all_parameters=True)
+        )
+    ]
+
+
 def _finalize_array(results: Sequence[Any]) -> Any:
     # special cases for length 1 results
     if len(results) == 1:
         np_like = _is_numpy_or_cupy_like(results[0])
         if isinstance(results[0], (int, ak.Array)) or np_like:  # type: ignore[unreachable]
             return results[0]
+    else:
+        return _finalize_many(results)
+
+
+def _finalize_many(results: Sequence[Any]) -> Any:
+    # classify the partition results in a single pass.
+    has_array = has_shapeless = False
+    all_int = all_none = True
+    for r in results:
+        if isinstance(r, ak.Array):
+            has_array = True
+            break
+        if r is not None:
+            all_none = False
+        if not isinstance(r, (int, np.integer)):
+            all_int = False
+        if _is_numpy_or_cupy_like(r) and r.shape == ():
+            has_shapeless = True
 
     # a sequence of arrays that need to be concatenated.
-    elif any(isinstance(r, ak.Array) for r in results):
-        return ak.concatenate(results)
+    if has_array:
+        return ak.concatenate(_without_redundant_empty_arrays(results))
 
     # a sequence of scalars that are stored as np.ndarray(N) where N
     # is a number (i.e. shapeless numpy array)
-    elif any(_is_numpy_or_cupy_like(r) for r in results) and any(
-        r.shape == () for r in results
-    ):
+    elif has_shapeless:
         return ak.Array(list(results))
 
     # in awkward < 2.5 we can get integers instead of np.array scalars
-    elif isinstance(results, (tuple, list)) and all(
-        isinstance(r, (int, np.integer)) for r in results
-    ):
+    elif isinstance(results, (tuple, list)) and all_int:
         return ak.Array(list(results))
 
     # sometimes all partition results will be None (some write-to-disk
     # operations)
-    elif all(r is None for r in results):
+    elif all_none:
         return None
 
     else:
@@ -881,6 +925,16 @@ def _finalize_array(results: Sequence[Any]) -> Any:
 dak_cache = cachetools.LRUCache(maxsize=1000)
 
 
+def _dak_cache_get(key: Hashable) -> Any:
+    # a single lookup: LRUCache.get is itself a membership test
+    # followed by an indexing, and the entry could be evicted between
+    # the two by another thread building a graph.
+    try:
+        return dak_cache[key]
+    except KeyError:
+        return None
+
+
 class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
     """Partitioned, lazy, and parallel Awkward Array Dask collection.
 
@@ -902,14 +956,24 @@ class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
     ) -> None:
         self._dask: HighLevelGraph = dsk
         self._name: str = name
-        self._divisions: tuple[int, ...] | tuple[None, ...] = divisions
+        self._divisions = divisions
         self._meta: ak.Array = meta
+        # (layout, type) pair of the meta the type was last derived from.
+        self._type_cache: tuple[Content, Type] | None = None
+        # (name, keys) pair of the collection's output keys.
+        self._keys_cache: tuple[str, NestedKeys] | None = None
 
     def __dask_graph__(self) -> HighLevelGraph:
         return self.dask
 
     def __dask_keys__(self) -> NestedKeys:
-        return [(self.name, i) for i in range(self.npartitions)]
+        # the keys only change with the name (which __setitem__ can
+        # replace) or the number of partitions.
+        cache = self._keys_cache
+        if cache is None or cache[0] != self._name or len(cache[1]) != self.npartitions:
+            cache = (self._name, [(self._name, i) for i in range(self.npartitions)])
+            self._keys_cache = cache
+        return cache[1]
 
     def __dask_layers__(self) -> tuple[str]:
         return (self.name,)
@@ -1002,7 +1066,6 @@ class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
           output partition. Note that exactly one output partition
           (npartitions=1) is a special case of this.
         """
-        from dask_awkward.layers import AwkwardMaterializedLayer
         from dask_awkward.lib.structure import (
             repartition_layer,
             simple_repartition_layer,
@@ -1026,7 +1089,7 @@ class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
         if npartitions and npartitions == 1:
             npartitions, n_to_one = None, self.npartitions
         if n_to_one or one_to_n:
-            token = tokenize(self, n_to_one, one_to_n)
+            token = tokenize(self.name, n_to_one, one_to_n)
             key = f"repartition-{token}"
             new_layer_raw, new_divisions = simple_repartition_layer(
                 self, n_to_one, one_to_n, key
@@ -1046,7 +1109,7 @@ class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
                 new_divs = list(range(0, nrows, rows_per_partition))
                 new_divs.append(nrows)
                 new_divisions = tuple(new_divs)
-            token = tokenize(self, divisions)
+            token = tokenize(self.name, divisions)
             key = f"repartition-{token}"
             new_layer_raw = repartition_layer(self, key, new_divisions)
 
@@ -1116,16 +1179,12 @@ class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
         return []
 
     def __dir__(self) -> list[str]:
-        fields = [] if self._meta is None else self._meta._layout.fields
+        fields = () if self._meta is None else tuple(self._meta._layout.fields)
         return sorted(
             set(
                 [x for x in dir(type(self)) if not x.startswith("_")]
                 + dir(super())
-                + [
-                    x
-                    for x in fields
-                    if _dir_pattern.match(x) and not keyword.iskeyword(x)
-                ]
+                + list(_attribute_fields(fields))
             )
         )
 
@@ -1153,26 +1212,39 @@ class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
         assert self._meta is not None
         return self._meta.ndim
 
+    @property
+    def _divisions(self) -> tuple[int, ...] | tuple[None, ...]:
+        return self._divs
+
+    @_divisions.setter
+    def _divisions(self, divisions: tuple[int, ...] | tuple[None, ...]) -> None:
+        # known_divisions and npartitions are read far more often than
+        # the divisions change; scanning the tuple for None on every
+        # read is O(npartitions).
+        self._divs = divisions
+        self._known_divisions = len(divisions) > 0 and None not in divisions
+        self._npartitions = len(divisions) - 1
+
     @property
     def divisions(self) -> tuple[int, ...] | tuple[None, ...]:
         """Location of the collections partition boundaries."""
-        return self._divisions
+        return self._divs
 
     @property
     def known_divisions(self) -> bool:
         """True if the divisions are known (absence of ``None`` in the tuple)."""
-        return len(self.divisions) > 0 and None not in self.divisions
+        return self._known_divisions
 
     @property
     def defined_divisions(self) -> tuple[int, ...]:
         if not self.known_divisions:
             raise ValueError("defined_divisions only works when divisions are known.")
-        return self._divisions  # type: ignore
+        return self._divs  # type: ignore
 
     @property
     def npartitions(self) -> int:
         """Total number of partitions."""
-        return len(self.divisions) - 1
+        return self._npartitions
 
     @property
     def layout(self) -> Content:
@@ -1217,48 +1289,59 @@ class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
     @property
     def type(self) -> ArrayType:
         """awkward Array type associated with the eventual computed result."""
-        t = ak.types.ArrayType(
-            self._meta._layout.form.type,
-            0,
-            behavior=self._meta._behavior,
-        )
+        t = ak.types.ArrayType(_type(self), 0, behavior=self._meta._behavior)
         t._length = "??"
         return t
 
-    @cached_property
+    @property
     def keys_array(self) -> np.ndarray:
         """NumPy array of task graph keys."""
+        # partition selection works on integer positions, so the
+        # object array is only built when asked for.
         return np.array(self.__dask_keys__(), dtype=object)
 
     def _partitions(self, index: Any) -> Array:
         # TODO: this produces a materialized layer, but could work like repartition() and slice()
         if not isinstance(index, tuple):
             index = (index,)
-        token = tokenize(self, index)
-        from dask.array.slicing import normalize_index
-
-        raw = normalize_index(index, (self.npartitions,))
-        index = tuple(slice(k, k + 1) if isinstance(k, Number) else k for k in raw)  # type: ignore
+        token = tokenize(self.name, index)
         name = f"partitions-{token}"
-        new_keys = self.keys_array[index].tolist()
-        dsk = {(name, i): tuple(key) for i, key in enumerate(new_keys)}
-        graph = HighLevelGraph.from_collections(
-            name,
-            AwkwardMaterializedLayer(dsk, previous_layer_names=[self.name]),
-            dependencies=(self,),
-        )
 
-        # if a single partition was requested we trivially know the new divisions.
-        if len(raw) == 1 and isinstance(raw[0], int) and self.known_divisions:
-            # TODO: don't we always know the divisions?
-            new_divisions = (
-                0,
-                self.divisions[raw[0] + 1] - self.divisions[raw[0]],  # type: ignore
-            )
-        # otherwise nullify the known divisions
+        # repeatedly selecting the same partitions (e.g. in a loop over
+        # partitions) reuses the layer instead of rebuilding it; the
+        # graph is always rebuilt from `self` (which may be persisted).
+        cache_key = (name, self.known_divisions)
+        cached = _dak_cache_get(cache_key)
+        if cached is not None:
+            layer, new_divisions = cached
         else:
-            new_divisions = (None,) * (len(new_keys) + 1)  # type: ignore
+            from dask.array.slicing import normalize_index
+
+            raw = normalize_index(index, (self.npartitions,))
+            (selection,) = raw
+            if isinstance(selection, (int, np.integer)):
+                selected: Sequence[int] = (int(selection),)
+            elif isinstance(selection, slice):
+                selected = range(*selection.indices(self.npartitions))
+            else:
+                # integer (or boolean) array of partitions
+                selected = np.arange(self.npartitions)[selection].tolist()
+            dsk = {(name, i): (self.name, j) for i, j in enumerate(selected)}
+            layer = AwkwardMaterializedLayer(dsk, previous_layer_names=[self.name])
+
+            # if a single partition was requested we trivially know the new divisions.
+            if len(raw) == 1 and isinstance(raw[0], int) and self.known_divisions:
+                # TODO: don't we always know the divisions?
+                new_divisions = (
+                    0,
+                    self.divisions[raw[0] + 1] - self.divisions[raw[0]],  # type: ignore
+                )
+            # otherwise nullify the known divisions
+            else:
+                new_divisions = (None,) * (len(dsk) + 1)
+            dak_cache[cache_key] = layer, new_divisions
 
+        graph = HighLevelGraph.from_collections(name, layer, dependencies=(self,))
         return new_array_object(
             graph, name, meta=self._meta, divisions=tuple(new_divisions)
         )
@@ -1432,32 +1515,25 @@ class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
             raise DaskAwkwardNotImplemented("negative step slice on zeroth dimension")
 
         # setup
-        token = tokenize(self, where)
+        token = tokenize(self.name, where)
         name = f"getitem-{token}"
         remainder = 0
         outpart = 0
         divisions = [0]
         dask = {}
-        # make low-level graph
-        for i in range(self.npartitions):
-            if start > self.defined_divisions[i + 1]:
-                # first partition not yet found
-                continue
-            if stop < self.defined_divisions[i] and dask:
+        divs = self.defined_divisions
+        # make low-level graph, starting from the first partition that
+        # can contain rows of the slice (the partitions before it are
+        # never visited).
+        for i in range(bisect.bisect_left(divs, start, 1) - 1, self.npartitions):
+            if stop < divs[i] and dask:
                 # no more partitions with valid rows
                 # does **NOT** exit if there are no partitions yet, to make sure there is always
                 # at least one, needed to get metadata of empty output right
                 break
-            slice_start = max(start - self.defined_divisions[i], 0 + remainder)
-            slice_end = min(
-                stop - self.defined_divisions[i],
-                self.defined_divisions[i + 1] - self.defined_divisions[i],
-            )
-            if (
-                slice_end == slice_start
-                and (self.defined_divisions[i + 1] - self.defined_divisions[i])
-                and dask
-            ):
+            slice_start = max(start - divs[i], 0 + remainder)
+            slice_end = min(stop - divs[i], divs[i + 1] - divs[i])
+            if slice_end == slice_start and (divs[i + 1] - divs[i]) and dask:
                 # in case of zero-row last partition (if not only partition)
                 break
             dask[(name, outpart)] = (
@@ -1467,10 +1543,7 @@ class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
                 rest,
             )
             outpart += 1
-            remainder = (
-                (self.defined_divisions[i] + slice_start)
-                - self.defined_divisions[i + 1]
-            ) % step
+            remainder = ((divs[i] + slice_start) - divs[i + 1]) % step
             remainder = step - remainder if remainder < 0 else remainder
             nextdiv = math.ceil((slice_end - slice_start) / step)
             divisions.append(divisions[-1] + nextdiv)
@@ -1565,6 +1638,30 @@ class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
 
         raise DaskAwkwardNotImplemented(f"__getitem__ doesn't support where={where}.")
 
+    def _getitem_field(self, where: str) -> Any:
+        return self._getitem_outer_str_or_list(where, label=where)
+
+    def _getitem_list(self, where: list) -> Any:
+        # don't accept lists containing integers.
+        if any(isinstance(k, int) for k in where):
+            # this is something we'll likely never support so we
+            # do not use the DaskAwkwardNotImplemented exception.
+            raise RuntimeError("Lists containing integers are not supported.")
+        return self._getitem_outer_str_or_list(where)
+
+    def _getitem_ellipsis(self, where: Any) -> Array:
+        return self
+
+    # handlers for the common (exact) types of `where`; anything else
+    # goes through the checks in _getitem_single.
+    _getitem_dispatch: dict[builtins.type, Callable[[Array, Any], Any]] = {
+        str: _getitem_field,
+        list: _getitem_list,
+        tuple: _getitem_tuple,
+        int: _getitem_outer_int,
+        _EllipsisType: _getitem_ellipsis,
+    }
+
     def __getitem__(self, where):
         """Select items from the collection.
 
@@ -1582,16 +1679,20 @@ class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
 
         """
 
-        # don't accept lists containing integers.
+        handler = self._getitem_dispatch.get(type(where))
+        if handler is not None:
+            return handler(self, where)
+
+        # subclasses of the dispatched types, and NumPy integers
         if isinstance(where, list):
-            if any(isinstance(k, int) for k in where):
-                # this is something we'll likely never support so we
-                # do not use the DaskAwkwardNotImplemented exception.
-                raise RuntimeError("Lists containing integers are not supported.")
+            return self._getitem_list(where)
 
         if isinstance(where, tuple):
             return self._getitem_tuple(where)
 
+        if isinstance(where, (int, np.integer)):
+            return self._getitem_outer_int(operator.index(where))
+
         return self._getitem_single(where)
 
     def _is_method_heuristic(self, resolved: Any) -> bool:
@@ -1674,7 +1775,13 @@ class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
         return map_partitions(func, self, *args, traverse=traverse, **kwargs)
 
     def eager_compute_divisions(self) -> None:
-        """Force a compute of the divisions."""
+        """Force a compute of the divisions.
+
+        Nothing is computed if the divisions are already known.
+
+        """
+        if self.known_divisions:
+            return
         self._divisions = calculate_known_divisions(self)
 
     def clear_divisions(self) -> None:
@@ -1710,6 +1817,7 @@ class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
         return _map_partitions(
             ufunc,
             *inputs,
+            token=tokenize(_ufunc_token(ufunc), *inputs, 1, **kwargs),
             output_divisions=1,
             **kwargs,
         )
@@ -1777,7 +1885,9 @@ class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
 
         By default this is then processed eagerly and returned.
         """
-        out = self.partitions[0].map_partitions(lambda x: x[:nrow], meta=self._meta)
+        out = self.partitions[0]._map_partitions(
+            operator.getitem, slice(None, nrow), label="head", meta=self._meta
+        )
         if compute:
             return out.compute()
         if self.known_divisions:
@@ -1874,7 +1984,9 @@ def new_array_object(
             raise TypeError(
                 f"meta must be an instance of an Awkward Array, not {type(meta)}."
             )
-        if ak.backend(meta) != "typetracer":
+        # every new collection passes through here; checking the layout
+        # backend directly avoids the dispatch machinery of ak.backend.
+        if meta.layout.backend.name != "typetracer":
             raise TypeError(
                 f"meta Array must have a typetracer backend, not {ak.backend(meta)}"
             )
@@ -1892,6 +2004,14 @@ def new_array_object(
     return out
 
 
+def _ufunc_token(ufunc: np.ufunc) -> Any:
+    # dask tokenizes ufuncs by pickling them; NumPy's own ufuncs are
+    # fully identified by their name.
+    if getattr(np, ufunc.__name__, None) is ufunc:
+        return ("numpy-ufunc", ufunc.__name__)
+    return ufunc
+
+
 def partitionwise_layer(
     func: Callable,
     name: str,
@@ -1945,6 +2065,10 @@ def partitionwise_layer(
             )
         else:
             pairs.extend([arg, None])
+    # even with a single collection argument the layer stays Blockwise
+    # (not a materialized dict): building it is cheap next to the meta
+    # pass, and only blockwise layers are fused by rewrite_layer_chains
+    # and read by the columns optimization.
     layer = dask_blockwise(
         func,
         name,
@@ -2018,8 +2142,9 @@ def _map_partitions(
     ]
     dak_arrays = tuple(filter(lambda x: isinstance(x, Array), deps))
 
-    if name in dak_cache:
-        hlg, meta = dak_cache[name]
+    cached = _dak_cache_get(name)
+    if cached is not None:
+        hlg, meta = cached
     else:
         lay = partitionwise_layer(
             fn,
@@ -2193,17 +2318,80 @@ def map_partitions(
         kwarg_repacker,
         arg_lens_for_repackers,
     )
+    # the repackers are not deterministically tokenizable; the
+    # original arguments are (and collections tokenize by name).
+    token = token or tokenize(
+        base_fn, *args, meta, output_divisions, traverse, **kwargs
+    )
     return _map_partitions(
         fn,
         *arg_flat_deps_expanded,
         *kwarg_flat_deps,
-        label=label,
+        label=label or funcname(base_fn),
         token=token,
         meta=meta,
         output_divisions=output_divisions,
     )
 
 
+# NumPy equivalents of awkward reducers (same result dtypes); used
+# for flat numeric chunks, where walking the layout in awkward costs
+# far more than the reduction itself.
+_NUMPY_REDUCERS: dict[Callable, Callable] = {
+    ak.all: np.all,
+    ak.any: np.any,
+    ak.count_nonzero: np.count_nonzero,
+    ak.max: np.max,
+    ak.min: np.min,
+    ak.prod: np.prod,
+    ak.sum: np.sum,
+}
+
+# awkward's max/min skip NaN and give the identity for an all-NaN
+# chunk; fmax/fmin reductions starting from that identity match.
+_NUMPY_FLOAT_REDUCERS: dict[Callable, tuple[Callable, float]] = {
+    ak.max: (np.fmax.reduce, -np.inf),
+    ak.min: (np.fmin.reduce, np.inf),
+}
+
+
+def _reduce_flat_numeric_chunk(
+    chunk: ak.Array,
+    reducer: Callable,
+    mask_identity: bool,
+) -> ak.Array | None:
+    """Reduce a one-dimensional numeric chunk along axis 0 with NumPy.
+
+    Returns ``None`` if the chunk (or reducer) is not eligible, in
+    which case the awkward reducer should be used.
+    """
+    np_reducer = _NUMPY_REDUCERS.get(reducer)
+    if np_reducer is None:
+        return None
+    layout = chunk.layout
+    if isinstance(layout, ak.contents.UnmaskedArray):
+        layout = layout.content
+    if (
+        not isinstance(layout, ak.contents.NumpyArray)
+        or layout.backend.name != "cpu"
+        or layout.parameters
+        or layout.data.ndim != 1
+        or layout.data.dtype.kind not in "biuf"
+        # the identity of an empty reduction is awkward's business
+        or len(layout.data) == 0
+    ):
+        return None
+    if layout.data.dtype.kind == "f" and reducer in _NUMPY_FLOAT_REDUCERS:
+        nan_reducer, identity = _NUMPY_FLOAT_REDUCERS[reducer]
+        data = nan_reducer(layout.data, axis=0, keepdims=True, initial=identity)
+    else:
+        data = np_reducer(layout.data, axis=0, keepdims=True)
+    result: Content = ak.contents.NumpyArray(data)
+    if mask_identity:
+        result = ak.contents.UnmaskedArray(result)
+    return ak.Array(result, behavior=chunk.behavior, attrs=chunk.attrs)
+
+
 def _chunk_reducer_non_positional(
     chunk: ak.Array,
     is_axis_none: bool,
@@ -2211,6 +2399,10 @@ def _chunk_reducer_non_positional(
     reducer: Callable,
     mask_identity: bool,
 ) -> ak.Array:
+    if not is_axis_none:
+        result = _reduce_flat_numeric_chunk(chunk, reducer, mask_identity)
+        if result is not None:
+            return result
     return reducer(
         chunk,
         keepdims=True,
@@ -2280,6 +2472,15 @@ def non_trivial_reduction(
     elif axis is not None:
         raise ValueError(axis)
 
+    # For flat numeric arrays reducing over all axes is the same as
+    # reducing over axis=0, which avoids restructuring every chunk.
+    if (
+        axis is None
+        and isinstance(array.form, ak.forms.NumpyForm)
+        and not array.form.inner_shape
+    ):
+        axis = 0
+
     if combiner is None:
         combiner = reducer
 
@@ -2295,8 +2496,6 @@ def non_trivial_reduction(
     else:
         prepared_array = array
 
-    from dask_awkward.layers import AwkwardTreeReductionLayer
-
     token = token or tokenize(
         array,
         reducer,
@@ -2389,8 +2588,10 @@ def calculate_known_divisions(array: Array) -> tuple[int, ...]:
         return (0, num.compute())
 
     # if more than 1 partition cumulative sum required
-    cs = list(np.cumsum(num.compute()))
-    return tuple([0, *cs])
+    lengths = np.asarray(num.compute(), dtype=np.int64)
+    divisions = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=divisions[1:])
+    return tuple(divisions.tolist())
 
 
 def _type(array: Array) -> Type | None:
@@ -2408,9 +2609,17 @@ def _type(array: Array) -> Type | None:
         contain metadata ``None`` is returned.
 
     """
-    if array._meta is not None:
-        return array._meta.layout.form.type
-    return None
+    if array._meta is None:
+        return None
+    # deriving the type walks the whole form; only redo that when the
+    # metadata has been replaced since the last call.
+    layout = array._meta.layout
+    cached = array._type_cache
+    if cached is not None and cached[0] is layout:
+        return cached[1]
+    t = layout.form.type
+    array._type_cache = (layout, t)
+    return t
 
 
 def is_awkward_collection(obj: Any) -> bool:
@@ -2635,8 +2844,14 @@ def empty_typetracer() -> ak.Array:
         Length-less typetracer array (content-less array).
 
     """
-    a = ak.Array([])
-    return ak.Array(a.layout.to_typetracer(forget_length=True))
+    # a new high-level array every time: new_array_object may set its
+    # behavior and attrs.
+    return ak.Array(_empty_typetracer_layout())
+
+
+@lru_cache(maxsize=1)
+def _empty_typetracer_layout() -> Content:
+    return ak.Array([]).layout.to_typetracer(forget_length=True)
 
 
 class _BehaviorMethodFn:
@@ -2687,13 +2902,14 @@ def normalize_single_outer_inner_index(
     (2, 2)
 
     """
+    # numpy integers become python ints up front.
+    index = operator.index(index)
     if index < 0:
         index = divisions[-1] + index
     if len(divisions) == 2:
-        return (0, int(index))
-    partition_index = int(np.digitize(index, divisions)) - 1
-    new_index = index - divisions[partition_index]
-    return (int(partition_index), int(new_index))
+        return (0, index)
+    partition_index = bisect.bisect_right(divisions, index) - 1
+    return (partition_index, index - divisions[partition_index])
 
 
 def make_unknown_length(array: ak.Array) -> ak.Array:
@@ -2765,10 +2981,13 @@ class PartitionCompatibility(IntEnum):
             return PartitionCompatibility.MAYBE
 
         # at this point we have a reference array to compare divisions
+        # collections derived partitionwise from one another share the
+        # same divisions tuple, which skips the element-wise comparison.
+        refdivs = refarr.divisions
         ngood = 0
         for arg in args:
             if arg.known_divisions:
-                if arg.divisions != refarr.divisions:
+                if arg.divisions is not refdivs and arg.divisions != refdivs:
                     return PartitionCompatibility.NO
                 else:
                     ngood += 1
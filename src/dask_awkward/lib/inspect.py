@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import operator
 from typing import TYPE_CHECKING, Any, NamedTuple
 
 import numpy as np
@@ -265,7 +266,9 @@ def sample(
     ):
         raise ValueError("Give exactly one of factor or probability")
     if factor:
-        return arr.map_partitions(lambda x: x[::factor], meta=arr._meta)
+        return arr._map_partitions(
+            operator.getitem, slice(None, None, factor), label="sample", meta=arr._meta
+        )
     assert probability is not None
     proba = float(probability)
     return arr.map_partitions(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import logging
 import math
 from collections.abc import Callable, Iterable, Mapping
@@ -13,6 +14,8 @@ import numpy as np
 from awkward.types.numpytype import primitive_to_dtype
 from awkward.typetracer import length_zero_if_typetracer
 from dask.base import flatten, tokenize
+from dask.blockwise import blockwise as dask_blockwise
+from dask.delayed import Delayed
 from dask.highlevelgraph import HighLevelGraph
 from dask.local import identity
 from dask.utils import funcname, is_integer, parse_bytes
@@ -44,7 +47,6 @@ if TYPE_CHECKING:
     from dask.array.core import Array as DaskArray
     from dask.bag.core import Bag as DaskBag
     from dask.dataframe import DataFrame as DaskDataFrame
-    from dask.delayed import Delayed
     from fsspec.spec import AbstractFileSystem
 
 
@@ -69,8 +71,11 @@ class FromAwkwardFn(ColumnProjectionMixin):
 
     def __call__(self, *args, **kwargs):
         start, stop = args[0]
-        arr = cast(ak.Array, self.arr[start:stop])
-        return ak.Array(arr, behavior=self.behavior, attrs=self.attrs)
+        # a range slice of a layout is a view on the same buffers;
+        # slicing the layout avoids wrapping the partition in a
+        # high-level array twice.
+        layout = self.arr.layout[start:stop]
+        return ak.Array(layout, behavior=self.behavior, attrs=self.attrs)
 
     def project_columns(self, columns):
         return type(self)(self.arr, self.behavior, self.attrs)
@@ -140,7 +145,39 @@ class _FromListsFn:
         self.attrs = attrs
 
     def __call__(self, x: list) -> ak.Array:
-        return ak.Array(x, behavior=self.behavior, attrs=self.attrs)
+        layout = _list_of_numeric_lists_layout(x)
+        if layout is None:
+            return ak.Array(x, behavior=self.behavior, attrs=self.attrs)
+        return ak.Array(layout, behavior=self.behavior, attrs=self.attrs)
+
+
+def _list_of_numeric_lists_layout(x: list) -> ak.contents.Content | None:
+    """Build a list-of-numbers layout from offsets and flat data.
+
+    Returns ``None`` unless `x` is a list of lists containing only
+    Python ``int`` and ``float`` objects, in which case the result is
+    the same as building the array with :class:`ak.ArrayBuilder`
+    (int64 data, or float64 if any element is a float), without the
+    per-element builder calls.
+
+    """
+    if not all(type(row) is list for row in x):
+        return None
+    flat = list(itertools.chain.from_iterable(x))
+    kinds = set(map(type, flat))
+    if not flat or not kinds <= {int, float}:
+        return None
+    dtype = np.float64 if float in kinds else np.int64
+    try:
+        data = np.array(flat, dtype=dtype)
+    except OverflowError:
+        return None
+    offsets = np.empty(len(x) + 1, dtype=np.int64)
+    offsets[0] = 0
+    np.cumsum(np.fromiter(map(len, x), dtype=np.int64, count=len(x)), out=offsets[1:])
+    return ak.contents.ListOffsetArray(
+        ak.index.Index64(offsets), ak.contents.NumpyArray(data)
+    )
 
 
 def from_lists(
@@ -226,8 +263,6 @@ def from_delayed(
         Resulting Array collection.
 
     """
-    from dask.delayed import Delayed
-
     parts = [source] if isinstance(source, Delayed) else source
     name = f"{prefix}-{tokenize(parts)}"
     dsk = AwkwardMaterializedLayer(
@@ -263,8 +298,6 @@ def to_delayed(array: Array, optimize_graph: bool = True) -> list[Delayed]:
         List of delayed objects (one per partition).
 
     """
-    from dask.delayed import Delayed
-
     keys = array.__dask_keys__()
     graph = array.__dask_graph__()
     layer = array.__dask_layers__()[0]
@@ -282,6 +315,25 @@ def to_dask_bag(array: Array) -> DaskBag:
     return Bag(array.dask, array.name, array.npartitions)
 
 
+class _ToNumpyFn:
+    def __init__(self, dtype: Any = None) -> None:
+        self.dtype = dtype
+
+    def __call__(self, array: ak.Array) -> np.ndarray:
+        layout = array.layout
+        # a flat array without missing values is already a NumPy
+        # buffer; hand out a view instead of converting the layout.
+        if isinstance(layout, ak.contents.UnmaskedArray):
+            layout = layout.content
+        if isinstance(layout, ak.contents.NumpyArray) and not layout.parameters:
+            data = layout.data
+        else:
+            data = ak.to_numpy(array)
+        if self.dtype is None:
+            return data
+        return data.astype(self.dtype, copy=False)
+
+
 def to_dask_array(
     array: Array,
     *,
@@ -330,20 +382,23 @@ def to_dask_array(
             meta=array._meta,
         )
 
+    # the partition lengths are the chunks along the first axis.
+    outer_chunks: tuple[float, ...]
+    if array.known_divisions:
+        divs = np.array(array.divisions)
+        outer_chunks = tuple(divs[1:] - divs[:-1])
+    else:
+        outer_chunks = (np.nan,) * array.npartitions
+
     if ndim == 1:
-        new = map_partitions(ak.to_numpy, array, meta=empty_typetracer())
+        new = map_partitions(_ToNumpyFn(dtype), array, meta=empty_typetracer())
         graph = new.dask
         dtype = dtype or primitive_to_dtype(array._meta.layout.form.type.primitive)
-        if array.known_divisions:
-            divs = np.array(array.divisions)
-            chunks: tuple[tuple[float, ...], ...] = (tuple(divs[1:] - divs[:-1]),)
-        else:
-            chunks = ((np.nan,) * array.npartitions,)
         return new_da_object(
             graph,
             new.name,
             meta=None,
-            chunks=chunks,
+            chunks=(outer_chunks,),
             dtype=dtype,
         )
 
@@ -358,12 +413,12 @@ def to_dask_array(
 
         name = f"to-dask-array-{tokenize(array)}"
         nan_tuples_innerdims = ((np.nan,),) * (ndim - 1)
-        chunks = ((np.nan,) * array.npartitions, *nan_tuples_innerdims)
+        chunks = (outer_chunks, *nan_tuples_innerdims)
         zeros = (0,) * (ndim - 1)
 
         # eventually convert to HLG (if possible)
         llg = {
-            (name, i, *zeros): (ak.to_numpy, k)
+            (name, i, *zeros): (_ToNumpyFn(dtype), k)
             for i, k in enumerate(flatten(array.__dask_keys__()))
         }
 
@@ -409,9 +464,6 @@ def from_dask_array(
     dask.awkward<from-dask-array, npartitions=4>
 
     """
-
-    from dask.blockwise import blockwise as dask_blockwise
-
     token = tokenize(array)
     name = f"from-dask-array-{token}"
     meta = typetracer_array(ak.from_numpy(array._meta))
@@ -533,6 +585,7 @@ def from_map(
     token: str | None = None,
     divisions: tuple[int, ...] | tuple[None, ...] | None = None,
     meta: ak.Array | None = None,
+    execute_mode: str = "graph",
     **kwargs: Any,
 ) -> Array | tuple[Array, Array]:
     """Create an Array collection from a custom mapping.
@@ -559,6 +612,18 @@ def from_map(
     meta : Array, optional
         Collection metadata array, if known (the awkward-array type
         tracer)
+    execute_mode : str
+        Either ``"graph"`` (the default) or ``"futures"``. With
+        ``"graph"`` the partitions are created by a lazy input layer
+        in the task graph. With ``"futures"`` and an active
+        ``dask.distributed`` client, `func` is immediately submitted
+        with ``Client.map`` (batching the submission of many small
+        tasks) and the collection wraps the resulting futures, like a
+        persisted collection. This skips graph construction and
+        optimization for workloads with many cheap partitions, but
+        the necessary columns optimization can no longer be applied
+        to the reading. Without a client ``"futures"`` behaves like
+        ``"graph"``.
     **kwargs : Any
         Keyword arguments passed to `func`.
 
@@ -571,6 +636,10 @@ def from_map(
 
     if not callable(func):
         raise ValueError("`func` argument must be `callable`")
+    if execute_mode not in ("graph", "futures"):
+        raise ValueError(
+            f"execute_mode must be 'graph' or 'futures', got {execute_mode!r}"
+        )
     lengths = set()
     iters: list[Iterable] = list(iterables)
     for i, iterable in enumerate(iters):
@@ -640,6 +709,16 @@ def from_map(
         io_func = func
         array_meta = None
 
+    if execute_mode == "futures":
+        client = _default_client()
+        if client is not None:
+            if (
+                io_func_implements_report(io_func)
+                and cast(ImplementsReport, io_func).return_report
+            ):
+                raise ValueError("execute_mode='futures' does not support reports.")
+            return _from_futures(client, io_func, inputs, name, array_meta, divisions)
+
     dsk = AwkwardInputLayer(name=name, inputs=inputs, io_func=io_func)
 
     hlg = HighLevelGraph.from_collections(name, dsk)
@@ -697,6 +776,43 @@ def from_map(
     return result
 
 
+def _default_client() -> Any:
+    try:
+        from distributed import get_client
+    except ImportError:
+        return None
+    try:
+        return get_client()
+    except ValueError:
+        return None
+
+
+def _from_futures(
+    client: Any,
+    io_func: Callable,
+    inputs: list[Any],
+    name: str,
+    meta: ak.Array | None,
+    divisions: tuple[int, ...] | tuple[None, ...] | None,
+) -> Array:
+    nworkers = max(1, len(client.scheduler_info()["workers"]))
+    futures = client.map(
+        io_func,
+        inputs,
+        key=[(name, i) for i in range(len(inputs))],
+        pure=True,
+        batch_size=max(1, len(inputs) // (4 * nworkers)),
+    )
+    dsk = AwkwardMaterializedLayer(
+        {future.key: future for future in futures},
+        previous_layer_names=[],
+    )
+    hlg = HighLevelGraph.from_collections(name, dsk)
+    if divisions is not None:
+        return new_array_object(hlg, name, meta=meta, divisions=divisions)
+    return new_array_object(hlg, name, meta=meta, npartitions=len(inputs))
+
+
 @dataclass
 class _BytesReadingInstructions:
     fs: AbstractFileSystem
@@ -853,3 +969,52 @@ def _bytes_with_sample(
             sample_bytes = sample_bytes[:rfind]
 
     return out, sample_bytes
+
+
+def _aggregate_paths(
+    fs: AbstractFileSystem,
+    paths: list[str],
+    blocksize: str | int,
+) -> list[tuple[str, ...]]:
+    """Group consecutive paths into partitions of roughly `blocksize` bytes.
+
+    This function is for internal use in from_json and from_parquet
+    when many small files should be read by fewer tasks. Files are
+    packed greedily (in order); a file larger than `blocksize` (or
+    with unknown size) gets a group of its own.
+
+    Parameters
+    ----------
+    fs : AbstractFileSystem
+        Filesystem where data lives.
+    paths : list[str]
+        Paths to the data.
+    blocksize : str | int
+        Target total size of the files in each group.
+
+    Returns
+    -------
+    list[tuple[str, ...]]
+        Groups of paths, one per partition.
+
+    """
+    if isinstance(blocksize, str):
+        blocksize = parse_bytes(blocksize)
+    if not is_integer(blocksize):
+        raise TypeError("blocksize must be an integer")
+    blocksize = int(blocksize)
+
+    groups: list[tuple[str, ...]] = []
+    group: list[str] = []
+    group_size = 0
+    for path, size in zip(paths, fs.sizes(paths)):
+        if size is None:
+            size = blocksize
+        if group and group_size + size > blocksize:
+            groups.append(tuple(group))
+            group, group_size = [], 0
+        group.append(path)
+        group_size += size
+    if group:
+        groups.append(tuple(group))
+    return groups
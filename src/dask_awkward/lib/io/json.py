@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import abc
+import itertools
 import logging
 import math
+import warnings
 from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING, Any, Literal, cast, overload
 
 import awkward as ak
+import cachetools
 import dask
 from awkward.forms.form import Form
 from dask.base import tokenize
@@ -27,6 +30,7 @@ from dask_awkward.lib.core import (
 )
 from dask_awkward.lib.io.columnar import ColumnProjectionMixin
 from dask_awkward.lib.io.io import (
+    _aggregate_paths,
     _bytes_with_sample,
     _BytesReadingInstructions,
     from_map,
@@ -85,6 +89,7 @@ class FromJsonFn(ColumnProjectionMixin):
             storage=self.storage,
             compression=self.compression,
             behavior=self.behavior,
+            attrs=self.attrs,
             **self.kwargs,
         )
 
@@ -111,19 +116,39 @@ class FromJsonLineDelimitedFn(FromJsonFn):
             **kwargs,
         )
 
-    def __call__(self, source: str) -> ak.Array:
-        with self.storage.open(source, mode="rt", compression=self.compression) as f:
-            array = ak.from_json(
-                f.read(),
-                line_delimited=True,
-                schema=self.schema,
-                **self.kwargs,
-            )
+    def __call__(self, source: str | tuple[str, ...]) -> ak.Array:
+        if isinstance(source, str):
+            # the parser reads from the (possibly decompressing) file
+            # object in `buffersize` chunks, so the whole file is never
+            # held in memory as a single bytestring.
+            with self.storage.open(
+                source, mode="rb", compression=self.compression
+            ) as f:
+                array = self._parse(f)
+        else:
+            chunks = []
+            for path in source:
+                with self.storage.open(
+                    path, mode="rb", compression=self.compression
+                ) as f:
+                    chunks.append(f.read())
+            # line delimited documents can be parsed in a single pass
+            array = self._parse(b"\n".join(chunks))
         log.debug("columns read from disk: %s" % str(array.layout.form.columns()))
         assert isinstance(array, ak.Array)
         return array
         # return ak.Array(unproject_layout(self.original_form, array.layout))
 
+    def _parse(self, source: Any) -> ak.Array:
+        return ak.from_json(
+            source,
+            line_delimited=True,
+            schema=self.schema,
+            behavior=self.behavior,
+            attrs=self.attrs,
+            **self.kwargs,
+        )
+
 
 class FromJsonSingleObjPerFile(FromJsonFn):
     def __init__(
@@ -147,18 +172,20 @@ class FromJsonSingleObjPerFile(FromJsonFn):
             **kwargs,
         )
 
-    def __call__(self, source: str) -> ak.Array:
-        with self.storage.open(source, mode="rt", compression=self.compression) as f:
-            array = ak.Array(
-                [
+    def __call__(self, source: str | tuple[str, ...]) -> ak.Array:
+        sources = (source,) if isinstance(source, str) else source
+        objects = []
+        for path in sources:
+            with self.storage.open(path, mode="rb", compression=self.compression) as f:
+                objects.append(
                     ak.from_json(
-                        f.read(),
+                        f,
                         line_delimited=False,
                         schema=self.schema,
                         **self.kwargs,
                     )
-                ]
-            )
+                )
+        array = ak.Array(objects, behavior=self.behavior, attrs=self.attrs)
         log.debug("columns read from disk: %s" % str(array.layout.form.columns()))
         assert isinstance(array, ak.Array)
         return array
@@ -205,6 +232,8 @@ class FromJsonBytesFn(FromJsonFn):
             bytestring,
             line_delimited=True,
             schema=self.schema,
+            behavior=self.behavior,
+            attrs=self.attrs,
             **self.kwargs,
         )
         log.debug("columns read from disk: %s" % str(array.layout.form.columns()))
@@ -220,8 +249,10 @@ def meta_from_single_file(
     compression: str | None,
     **kwargs: Any,
 ) -> ak.Array:
-    with fs.open(paths[0], compression=compression) as f:
-        array = ak.Array([ak.from_json(f.read(), line_delimited=False, **kwargs)])
+    with fs.open(paths[0], mode="rb", compression=compression) as f:
+        # the file object is streamed to the parser, as in
+        # FromJsonSingleObjPerFile, instead of read into one bytestring.
+        array = ak.Array([ak.from_json(f, line_delimited=False, **kwargs)])
     return typetracer_array(array)
 
 
@@ -251,15 +282,11 @@ def meta_from_line_by_line(
     **kwargs: Any,
 ) -> ak.Array:
     if sample_rows is not None:
-        lines = []
-        with fs.open(paths[0], mode="rt", compression=compression) as f:
-            for i, line in enumerate(f):
-                lines.append(line)
-                if i >= sample_rows:
-                    break
-        array = ak.from_json("\n".join(lines), line_delimited=True, **kwargs)
+        with fs.open(paths[0], mode="rb", compression=compression) as f:
+            sample = b"".join(itertools.islice(f, sample_rows))
+        array = ak.from_json(sample, line_delimited=True, **kwargs)
     else:
-        with fs.open(paths[0], mode="rt", compression=compression) as f:
+        with fs.open(paths[0], mode="rb", compression=compression) as f:
             array = ak.from_json(
                 f.read(),
                 line_delimited=True,
@@ -269,6 +296,31 @@ def meta_from_line_by_line(
     return typetracer_array(array)
 
 
+# metadata derived from sampling the first file, keyed on the file's
+# fsspec ukey (which changes with the file's modification time or
+# checksum), so repeated from_json calls do not read and parse the
+# same sample again.
+json_meta_cache = cachetools.LRUCache(maxsize=128)
+
+
+def _cached_meta(
+    derive: Callable[..., ak.Array],
+    *,
+    fs: AbstractFileSystem,
+    paths: list[str],
+    **kwargs: Any,
+) -> ak.Array:
+    key = tokenize(derive.__name__, fs, paths[0], fs.ukey(paths[0]), kwargs)
+    if key not in json_meta_cache:
+        json_meta_cache[key] = derive(fs=fs, paths=paths, **kwargs)
+    return json_meta_cache[key]
+
+
+def _group_paths(paths: list[str], n: int) -> list[tuple[str, ...]]:
+    # consecutive groups of `n` files, one group per partition.
+    return [tuple(paths[i : i + n]) for i in range(0, len(paths), n)]
+
+
 def _from_json_files(
     *,
     fs: AbstractFileSystem,
@@ -278,20 +330,24 @@ def _from_json_files(
     compression: str | None,
     sample_rows: int | None = 150,
     sample_bytes: str | int = "256 KiB",
+    aggregate_files: str | int | None = None,
+    files_per_partition: int | None = None,
     **kwargs: Any,
 ) -> Array:
     if compression == "infer":
         compression = infer_compression(paths[0])
 
     if not compression:
-        meta = meta_from_bytechunks(
+        meta = _cached_meta(
+            meta_from_bytechunks,
             fs=fs,
             paths=paths,
             sample_bytes=sample_bytes,
             **kwargs,
         )
     else:
-        meta = meta_from_line_by_line(
+        meta = _cached_meta(
+            meta_from_line_by_line,
             fs=fs,
             paths=paths,
             compression=compression,
@@ -299,7 +355,7 @@ def _from_json_files(
             **kwargs,
         )
 
-    token = tokenize(compression, meta, kwargs)
+    token = tokenize(compression, meta, aggregate_files, files_per_partition, kwargs)
 
     f = FromJsonLineDelimitedFn(
         storage=fs,
@@ -309,11 +365,17 @@ def _from_json_files(
         **kwargs,
     )
 
+    sources: list[str] | list[tuple[str, ...]] = paths
+    if aggregate_files is not None:
+        sources = _aggregate_paths(fs, paths, aggregate_files)
+    elif files_per_partition is not None:
+        sources = _group_paths(paths, files_per_partition)
+
     return cast(
         Array,
         from_map(
             f,
-            paths,
+            sources,
             label="from-json-files",
             token=token,
             meta=meta,
@@ -328,18 +390,23 @@ def _from_json_sopf(
     paths: list[str],
     schema: str | dict | list | None,
     compression: str | None,
+    aggregate_files: str | int | None = None,
+    files_per_partition: int | None = None,
     **kwargs: Any,
 ) -> Array:
     if compression == "infer":
         compression = infer_compression(paths[0])
 
-    meta = meta_from_single_file(
+    meta = _cached_meta(
+        meta_from_single_file,
         fs=fs,
         paths=paths,
         compression=compression,
         **kwargs,
     )
-    token = tokenize(token, compression, meta, kwargs)
+    token = tokenize(
+        token, compression, meta, aggregate_files, files_per_partition, kwargs
+    )
 
     f = FromJsonSingleObjPerFile(
         storage=fs,
@@ -349,11 +416,17 @@ def _from_json_sopf(
         **kwargs,
     )
 
+    sources: list[str] | list[tuple[str, ...]] = paths
+    if aggregate_files is not None:
+        sources = _aggregate_paths(fs, paths, aggregate_files)
+    elif files_per_partition is not None:
+        sources = _group_paths(paths, files_per_partition)
+
     return cast(
         Array,
         from_map(
             f,
-            paths,
+            sources,
             label="from-json-sopf",
             token=token,
             meta=meta,
@@ -377,6 +450,11 @@ def _from_json_bytes(
     if compression == "infer":
         compression = infer_compression(paths[0])
 
+    # sizes are parsed once, here, so that equivalent spellings (e.g.
+    # "128 MiB" and 134217728) give the same token.
+    blocksize = parse_bytes(blocksize)
+    sample_bytes = parse_bytes(sample_bytes)
+
     token = tokenize(
         fs,
         token,
@@ -461,6 +539,8 @@ def from_json(
     storage_options: dict[str, Any] | None = None,
     meta_sample_rows: int | None = 100,
     meta_sample_bytes: int | str = "10 kiB",
+    aggregate_files: int | str | None = None,
+    files_per_partition: int | None = None,
 ) -> Array:
     """Create an Array collection from JSON data.
 
@@ -503,10 +583,14 @@ def from_json(
         dask-awkward.
     behavior : dict, optional
         See :func:`ak.from_json`
+    attrs : dict, optional
+        See :func:`ak.from_json`
     blocksize : int, str, optional
         If ``None`` (default), the collection will be partitioned on a
         per-file bases. If defined, this sets the size (in bytes) of
-        each partition. Can be a string of the form ``"10 MiB"``.
+        each partition, so a single large file is split into multiple
+        partitions at ``delimiter`` boundaries. Can be a string of the
+        form ``"10 MiB"``. Only supported for line delimited data.
     delimiter : bytes, optional
         Delimiter to use for separating blocks; if ``blocksize`` is
         defined but this argument is not defined, the default is the
@@ -526,6 +610,19 @@ def from_json(
         When reading file partitioned on a blocksize basis this will
         be the number of bytes sampled from the first partition to
         determine the collection's metadata.
+    aggregate_files : int | str, optional
+        If defined, consecutive files are packed into the same
+        partition until their total size reaches this many bytes
+        (can be a string of the form ``"256 MiB"``). Useful for
+        datasets made of many small files, where one task per file
+        would be dominated by overhead. Cannot be combined with
+        ``blocksize`` or ``delimiter``.
+    files_per_partition : int, optional
+        If defined, every partition reads this many consecutive files
+        (the last partition may read fewer). An alternative to
+        ``aggregate_files`` when the file count, rather than the total
+        size, should bound each task. Cannot be combined with
+        ``aggregate_files``, ``blocksize`` or ``delimiter``.
 
     Returns
     -------
@@ -568,16 +665,31 @@ def from_json(
     if len(paths) == 0:
         raise OSError("%s resolved to no files" % source)
 
-    # allow either blocksize or delimieter being not-None to trigger
-    # line deliminated JSON reading.
-    if blocksize is not None and delimiter is None:
-        delimiter = b"\n"
-    elif blocksize is None and delimiter == b"\n":
-        blocksize = "128 MiB"
+    # whole files are grouped into partitions, which is incompatible
+    # with splitting files into byte blocks.
+    byte_blocks = blocksize is not None or delimiter is not None
+    if aggregate_files is not None and byte_blocks:
+        raise ValueError(
+            "aggregate_files cannot be combined with blocksize or delimiter."
+        )
+    if files_per_partition is not None:
+        if aggregate_files is not None or byte_blocks:
+            raise ValueError(
+                "files_per_partition cannot be combined with "
+                "aggregate_files, blocksize or delimiter."
+            )
+        if files_per_partition < 1:
+            raise ValueError("files_per_partition must be a positive integer.")
 
     # if line delimited is False we use the single object per file
-    # implementation.
+    # implementation; a file containing a single JSON object cannot be
+    # split on byte boundaries.
     if not line_delimited:
+        if blocksize is not None:
+            warnings.warn(
+                "blocksize is ignored when line_delimited=False; "
+                "the collection will be partitioned on a per-file basis."
+            )
         return _from_json_sopf(
             fs=fs,
             token=token,
@@ -592,8 +704,18 @@ def from_json(
             initial=initial,
             resize=resize,
             behavior=behavior,
+            attrs=attrs,
+            aggregate_files=aggregate_files,
+            files_per_partition=files_per_partition,
         )
 
+    # allow either blocksize or delimieter being not-None to trigger
+    # line deliminated JSON reading.
+    if blocksize is not None and delimiter is None:
+        delimiter = b"\n"
+    elif blocksize is None and delimiter == b"\n":
+        blocksize = "128 MiB"
+
     # if we are not using blocksize and delimiter we are partitioning
     # by file.
     if blocksize is None and delimiter is None:
@@ -611,8 +733,11 @@ def from_json(
             initial=initial,
             resize=resize,
             behavior=behavior,
+            attrs=attrs,
             sample_rows=meta_sample_rows,
             sample_bytes=meta_sample_bytes,
+            aggregate_files=aggregate_files,
+            files_per_partition=files_per_partition,
         )
 
     # if a `delimiter` and `blocksize` are defined we use the byte
@@ -627,6 +752,7 @@ def from_json(
             blocksize=blocksize,
             sample_bytes=meta_sample_bytes,
             behavior=behavior,
+            attrs=attrs,
             nan_string=nan_string,
             posinf_string=posinf_string,
             neginf_string=neginf_string,
@@ -678,6 +804,11 @@ class ToJsonFn:
         return None
 
 
+def _finalize_write(*_: Any) -> None:
+    """Finalize task depending on every write task; returns nothing."""
+    return None
+
+
 def to_json(
     array: Array,
     path: str,
@@ -768,7 +899,7 @@ def to_json(
     )
     map_res.dask.layers[map_res.name].annotations = {"ak_output": True}
     name = f"to-json-{tokenize(array, path)}"
-    dsk = {(name, 0): (lambda *_: None, map_res.__dask_keys__())}
+    dsk = {(name, 0): (_finalize_write, *map_res.__dask_keys__())}
     graph = HighLevelGraph.from_collections(
         name,
         AwkwardMaterializedLayer(dsk, previous_layer_names=[map_res.name]),
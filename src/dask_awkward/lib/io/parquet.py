@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import abc
-import itertools
+import functools
 import logging
 import math
 import operator
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
 
 import awkward as ak
 import awkward.operations.ak_from_parquet as ak_from_parquet
+import cachetools
 import dask
+import numpy as np
 from awkward.forms.form import Form
 from dask.base import tokenize
 from dask.blockwise import BlockIndex
@@ -21,7 +24,7 @@ from fsspec.core import get_fs_token_paths, url_to_fs
 from dask_awkward.layers.layers import AwkwardMaterializedLayer
 from dask_awkward.lib.core import Array, Scalar, map_partitions, new_scalar_object
 from dask_awkward.lib.io.columnar import ColumnProjectionMixin
-from dask_awkward.lib.io.io import from_map
+from dask_awkward.lib.io.io import _aggregate_paths, from_map
 from dask_awkward.lib.unproject_layout import unproject_layout
 
 if TYPE_CHECKING:
@@ -32,6 +35,212 @@ log = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+_FILTER_OPERATORS = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def _normalize_filters(filters: Any) -> list[list[tuple[str, str, Any]]]:
+    """Convert filters in disjunctive normal form to a list of conjunctions."""
+    if not filters:
+        raise ValueError("filters must be a non-empty list")
+    if isinstance(filters[0][0], str):
+        filters = [filters]
+    conjunctions = []
+    for conjunction in filters:
+        terms = []
+        for name, op, value in conjunction:
+            if op not in _FILTER_OPERATORS and op not in ("in", "not in"):
+                raise ValueError(f"Unsupported filter operator {op!r}")
+            terms.append((name, op, value))
+        conjunctions.append(terms)
+    return conjunctions
+
+
+def _filter_columns(filters: Any) -> set[str]:
+    return {name for terms in _normalize_filters(filters) for name, _, _ in terms}
+
+
+def _filters_to_expression(filters: Any) -> Any:
+    """Build the pyarrow dataset expression equivalent to `filters`."""
+    import pyarrow.compute as pc
+
+    conjunctions = []
+    for terms in _normalize_filters(filters):
+        parts = []
+        for name, op, value in terms:
+            field = pc.field(*name.split("."))
+            if op == "in":
+                parts.append(field.isin(value))
+            elif op == "not in":
+                parts.append(~field.isin(value))
+            else:
+                parts.append(_FILTER_OPERATORS[op](field, value))
+        conjunctions.append(functools.reduce(operator.and_, parts))
+    return functools.reduce(operator.or_, conjunctions)
+
+
+def _filters_to_mask(array: ak.Array, filters: Any) -> ak.Array:
+    """Evaluate `filters` row-wise on a concrete awkward array."""
+    conjunctions = []
+    for terms in _normalize_filters(filters):
+        parts = []
+        for name, op, value in terms:
+            column = array
+            for field in name.split("."):
+                column = column[field]
+            if column.ndim != 1:
+                raise ValueError(
+                    f"Cannot filter on column {name!r}; filters are only "
+                    "supported on columns with a single value per row."
+                )
+            if op in ("in", "not in"):
+                part = functools.reduce(
+                    operator.or_,
+                    (column == v for v in value),
+                    ak.zeros_like(column, dtype=bool),
+                )
+            else:
+                part = _FILTER_OPERATORS[op](column, value)
+            # as in pyarrow, a null value fails every comparison and is
+            # therefore kept by "not in".
+            part = ak.fill_none(part, False)
+            if op == "not in":
+                part = ~part
+            parts.append(part)
+        conjunctions.append(functools.reduce(operator.and_, parts))
+    return functools.reduce(operator.or_, conjunctions)
+
+
+def _thread_map(func: Any, items: list) -> list:
+    """Apply `func` to every item on a thread pool, keeping the order.
+
+    Used for per-file metadata requests, which on remote filesystems
+    are dominated by latency.
+    """
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(32, len(items))) as pool:
+        return list(pool.map(func, items))
+
+
+def _row_groups_from_filters(
+    fs: AbstractFileSystem,
+    paths: list[str],
+    filters: Any,
+) -> list[list[int]]:
+    """Select the row groups of each file that may satisfy `filters`.
+
+    Only the row group statistics in the Parquet footers are used; the
+    selected row groups can still contain rows that fail the filters.
+    """
+    import pyarrow.dataset as pad
+    from pyarrow.fs import FSSpecHandler, PyFileSystem
+
+    expression = _filters_to_expression(filters)
+    filesystem = PyFileSystem(FSSpecHandler(fs))
+    file_format = pad.ParquetFileFormat()
+
+    def selected(path: str) -> list[int]:
+        fragment = file_format.make_fragment(path, filesystem=filesystem)
+        return [
+            rg.id
+            for piece in fragment.split_by_row_group(expression)
+            for rg in piece.row_groups
+        ]
+
+    return _thread_map(selected, paths)
+
+
+parquet_meta_cache = cachetools.LRUCache(maxsize=128)
+
+
+def _read_metadata(
+    path: str | list[str],
+    *,
+    fs: AbstractFileSystem,
+    paths: list[str],
+    columns: str | list[str] | None,
+    ignore_metadata: bool,
+    scan_files: bool,
+) -> tuple:
+    """Read the dataset metadata, reusing the result of earlier calls.
+
+    Equivalent to ``ak_from_parquet.metadata`` without row group
+    selection, but the dataset is listed only once. Cache entries are
+    keyed on the listing and on the fsspec ``ukey`` of the files whose
+    footers are parsed, so changes on disk are picked up.
+    """
+    import pyarrow.parquet as pq
+
+    all_paths, path_for_schema, can_sub = ak_from_parquet._all_and_metadata_paths(
+        path, fs, paths, ignore_metadata, scan_files
+    )
+    scan_paths: list[str] = []
+    if scan_files and not path_for_schema.endswith("/_metadata"):
+        scan_paths = all_paths[1:] if path_for_schema in all_paths else all_paths
+    parsed = [path_for_schema, *scan_paths]
+    key = tokenize(fs, all_paths, parsed, _thread_map(fs.ukey, parsed), columns)
+    try:
+        return parquet_meta_cache[key]
+    except KeyError:
+        pass
+
+    def read_footer(p: str) -> Any:
+        with fs.open(p, "rb") as f:
+            return pq.ParquetFile(f)
+
+    schema_file, *scanned = _thread_map(read_footer, parsed)
+
+    list_indicator = "list.item"
+    for column_metadata in schema_file.schema:
+        if (
+            column_metadata.max_repetition_level > 0
+            and ".list.element" in column_metadata.path
+        ):
+            list_indicator = "list.element"
+            break
+
+    subform = ak._connect.pyarrow.form_handle_arrow(
+        schema_file.schema_arrow, pass_empty_field=True
+    )
+    if columns is not None:
+        subform = subform.select_columns(columns)
+    # an empty field at the root
+    column_prefix = ("",) if schema_file.schema_arrow.names == [""] else ()
+
+    metadata = schema_file.metadata
+    for apath, pfile in zip(scan_paths, scanned):
+        md = pfile.metadata
+        md.set_file_path(apath.rsplit("/", 1)[-1])
+        metadata.append_row_groups(md)
+
+    row_counts = None
+    if can_sub:
+        row_counts = [
+            metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)
+        ]
+    parquet_columns = subform.columns(
+        list_indicator=list_indicator, column_prefix=column_prefix
+    )
+    result = (
+        parquet_columns,
+        subform,
+        all_paths,
+        fs,
+        [None] * len(all_paths),
+        row_counts,
+        metadata,
+    )
+    parquet_meta_cache[key] = result
+    return result
+
 
 def report_failure(exception, *args, **kwargs):
     return ak.Array(
@@ -74,6 +283,7 @@ class FromParquetFn(ColumnProjectionMixin):
         allowed_exceptions: tuple[type[BaseException], ...] = (OSError,),
         behavior: Mapping | None = None,
         attrs: Mapping[str, Any] | None = None,
+        filters: Any = None,
         **kwargs: Any,
     ) -> None:
         self.fs = fs
@@ -88,11 +298,24 @@ class FromParquetFn(ColumnProjectionMixin):
         self.allowed_exceptions = allowed_exceptions
         self.behavior = behavior
         self.attrs = attrs
+        self.filters = filters
         self.kwargs = kwargs
 
     @abc.abstractmethod
     def __call__(self, *args, **kwargs): ...
 
+    def filter_rows(self, array: ak.Array) -> ak.Array:
+        """Drop the rows of a freshly read array that fail the filters."""
+        if self.filters is None:
+            return array
+        return array[_filters_to_mask(array, self.filters)]
+
+    def projection_form(self, columns: frozenset[str]) -> Form:
+        """Form to read for `columns`, including any filtered columns."""
+        if self.filters is not None:
+            columns = frozenset(columns) | _filter_columns(self.filters)
+        return self.form.select_columns(columns)
+
     @abc.abstractmethod
     def project_columns(self, columns): ...
 
@@ -115,6 +338,7 @@ class FromParquetFn(ColumnProjectionMixin):
             f"  unnamed_root={self.unnamed_root}\n"
             f"  columns={self.columns}\n"
             f"  behavior={self.behavior}\n"
+            f"  filters={self.filters}\n"
         )
         for key, val in self.kwargs.items():
             s += f"  {key}={val}\n"
@@ -148,10 +372,11 @@ class FromParquetFileWiseFn(FromParquetFn):
         )
 
     def read_fn(self, source: Any) -> Any:
+        sources = [source] if isinstance(source, str) else list(source)
         layout = ak_from_parquet._load(
-            [source],
+            sources,
             parquet_columns=self.columns,
-            subrg=[None],
+            subrg=[None] * len(sources),
             subform=self.form,
             highlevel=False,
             fs=self.fs,
@@ -159,10 +384,12 @@ class FromParquetFileWiseFn(FromParquetFn):
             attrs=self.attrs,
             **self.kwargs,
         )
-        return ak.Array(
-            unproject_layout(self.original_form, layout),
-            attrs=self.attrs,
-            behavior=self.behavior,
+        return self.filter_rows(
+            ak.Array(
+                unproject_layout(self.original_form, layout),
+                attrs=self.attrs,
+                behavior=self.behavior,
+            )
         )
 
     def __call__(self, *args, **kwargs):
@@ -179,13 +406,14 @@ class FromParquetFileWiseFn(FromParquetFn):
     def project_columns(self, columns):
         return FromParquetFileWiseFn(
             fs=self.fs,
-            form=self.form.select_columns(columns),
+            form=self.projection_form(columns),
             listsep=self.listsep,
             unnamed_root=self.unnamed_root,
             original_form=self.form,
             report=self.report,
             attrs=self.attrs,
             behavior=self.behavior,
+            filters=self.filters,
             **self.kwargs,
         )
 
@@ -214,12 +442,17 @@ class FromParquetFragmentWiseFn(FromParquetFn):
             **kwargs,
         )
 
-    def __call__(self, pair: Any) -> ak.Array:
+    def read_fn(self, pair: Any) -> ak.Array:
         subrg, source = pair
-        if isinstance(subrg, int):
-            subrg = [[subrg]]
+        if isinstance(source, str):
+            sources = [source]
+            subrg = [[subrg]] if isinstance(subrg, int) else [list(subrg)]
+        else:
+            # aggregated files, with the selected row groups of each
+            sources = list(source)
+            subrg = [list(rgs) for rgs in subrg]
         layout = ak_from_parquet._load(
-            [source],
+            sources,
             parquet_columns=self.columns,
             subrg=subrg,
             subform=self.form,
@@ -229,21 +462,36 @@ class FromParquetFragmentWiseFn(FromParquetFn):
             attrs=self.attrs,
             **self.kwargs,
         )
-        return ak.Array(
-            unproject_layout(self.original_form, layout),
-            behavior=self.behavior,
-            attrs=self.attrs,
+        return self.filter_rows(
+            ak.Array(
+                unproject_layout(self.original_form, layout),
+                behavior=self.behavior,
+                attrs=self.attrs,
+            )
         )
 
+    def __call__(self, *args, **kwargs):
+        pair = args[0]
+        if self.return_report:
+            try:
+                result = self.read_fn(pair)
+                return result, report_success(self.columns, pair)
+            except self.allowed_exceptions as err:
+                return self.mock_empty(), report_failure(err, pair)
+
+        return self.read_fn(pair)
+
     def project_columns(self, columns):
         return FromParquetFragmentWiseFn(
             fs=self.fs,
-            form=self.form.select_columns(columns),
+            form=self.projection_form(columns),
+            listsep=self.listsep,
             unnamed_root=self.unnamed_root,
             original_form=self.form,
             report=self.report,
             behavior=self.behavior,
             attrs=self.attrs,
+            filters=self.filters,
             **self.kwargs,
         )
 
@@ -264,6 +512,8 @@ def from_parquet(
     split_row_groups: bool | None = False,
     storage_options: dict[str, Any] | None = None,
     report: bool = False,
+    filters: list[tuple] | list[list[tuple]] | None = None,
+    aggregate_files: int | str | None = None,
 ) -> Array | tuple[Array, Array]:
     """Create an Array collection from a Parquet dataset.
 
@@ -301,6 +551,22 @@ def from_parquet(
         else ``False``.
     storage_options
         Storage options passed to fsspec.
+    filters
+        Row filters in disjunctive normal form, as accepted by
+        pyarrow: a list of ``(column, op, value)`` tuples that are
+        combined with AND, or a list of such lists that are combined
+        with OR. Supported operators are ``=``, ``==``, ``!=``, ``<``,
+        ``<=``, ``>``, ``>=``, ``in`` and ``not in``. As in pyarrow,
+        rows with a null value in a filtered column only pass a ``not
+        in`` filter. Row groups whose statistics exclude every matching
+        row are never read; the remaining rows are filtered with
+        awkward after reading. When defined, the collection has unknown
+        divisions.
+    aggregate_files
+        If defined, consecutive files are packed into the same
+        partition until their total size reaches this many bytes (can
+        be a string of the form ``"256 MiB"``). Only supported when
+        partitioning on a per-file basis.
 
     Returns
     -------
@@ -331,6 +597,8 @@ def from_parquet(
         split_row_groups,
         behavior,
         attrs,
+        filters,
+        aggregate_files,
     )
 
     (
@@ -341,10 +609,10 @@ def from_parquet(
         subrg,
         row_counts,
         metadata,
-    ) = ak_from_parquet.metadata(
+    ) = _read_metadata(
         path,
-        storage_options,
-        row_groups=None,
+        fs=fs,
+        paths=paths,
         columns=columns,
         ignore_metadata=ignore_metadata,
         scan_files=scan_files,
@@ -362,8 +630,68 @@ def from_parquet(
     if split_row_groups is None:
         split_row_groups = row_counts is not None and len(row_counts) > 1
 
+    if aggregate_files is not None and split_row_groups:
+        raise ValueError(
+            "aggregate_files is only supported when partitioning on a "
+            "per-file basis (split_row_groups=False)."
+        )
+
+    if filters is not None:
+        available = subform.columns()
+        for name in _filter_columns(filters):
+            if not any(c == name or c.startswith(f"{name}.") for c in available):
+                raise ValueError(
+                    f"Filter column {name!r} is not a column of the dataset "
+                    "(or was not selected with the columns argument)."
+                )
+
+        # Row group selection happens here, using footer statistics;
+        # the row-wise filter is applied by the read function after IO.
+        row_groups = _row_groups_from_filters(fs, actual_paths, filters)
+        if split_row_groups:
+            filtered_pairs: list[tuple[Any, Any]] = [
+                (irg, path)
+                for rgs, path in zip(row_groups, actual_paths)
+                for irg in rgs
+            ]
+        else:
+            filtered_pairs = [
+                (rgs, path) for rgs, path in zip(row_groups, actual_paths) if rgs
+            ]
+        if not filtered_pairs:
+            filtered_pairs = [([], actual_paths[0])]
+        elif aggregate_files is not None:
+            selected = {path: rgs for rgs, path in filtered_pairs}
+            filtered_pairs = [
+                (tuple(selected[path] for path in group), group)
+                for group in _aggregate_paths(fs, list(selected), aggregate_files)
+            ]
+
+        return from_map(
+            FromParquetFragmentWiseFn(
+                fs=fs,
+                form=subform,
+                listsep=listsep,
+                unnamed_root=unnamed_root,
+                max_gap=max_gap,
+                max_block=max_block,
+                footer_sample_size=footer_sample_size,
+                generate_bitmasks=generate_bitmasks,
+                behavior=behavior,
+                attrs=attrs,
+                report=report,
+                filters=filters,
+            ),
+            filtered_pairs,
+            label=label,
+            token=token,
+        )
+
     if split_row_groups is False or subrg is None:
         # file-wise
+        sources: list[str] | list[tuple[str, ...]] = actual_paths
+        if aggregate_files is not None:
+            sources = _aggregate_paths(fs, actual_paths, aggregate_files)
         return from_map(
             FromParquetFileWiseFn(
                 fs=fs,
@@ -378,26 +706,29 @@ def from_parquet(
                 attrs=attrs,
                 report=report,
             ),
-            actual_paths,
+            sources,
             label=label,
             token=token,
         )
     else:
         # row-group wise
+        rgs = [metadata.row_group(i) for i in range(metadata.num_row_groups)]
         if set(subrg) == {None}:
             rgs_paths = {path: 0 for path in actual_paths}
-            for i in range(metadata.num_row_groups):
-                fp = metadata.row_group(i).column(0).file_path
-                rgs_path = [p for p in rgs_paths if fp in p][
-                    0
-                ]  # returns 1st if fp is empty
-                rgs_paths[rgs_path] += 1
+            fp_paths: dict[str, str] = {}
+            for rg in rgs:
+                fp = rg.column(0).file_path
+                if fp not in fp_paths:
+                    # returns 1st if fp is empty
+                    fp_paths[fp] = [p for p in rgs_paths if fp in p][0]
+                rgs_paths[fp_paths[fp]] += 1
 
             subrg = [list(range(rgs_paths[_])) for _ in actual_paths]
 
-        rgs = [metadata.row_group(i) for i in range(metadata.num_row_groups)]
-        divisions = [0] + list(
-            itertools.accumulate([rg.num_rows for rg in rgs], operator.add)
+        divisions = np.zeros(len(rgs) + 1, dtype=np.int64)
+        np.cumsum(
+            np.fromiter((rg.num_rows for rg in rgs), dtype=np.int64, count=len(rgs)),
+            out=divisions[1:],
         )
         pairs = []
 
@@ -422,7 +753,7 @@ def from_parquet(
                 pairs,
                 label=label,
                 token=token,
-                divisions=tuple(divisions),
+                divisions=tuple(divisions.tolist()),
             ),
         )
 
@@ -443,18 +774,17 @@ def _metadata_file_from_data_files(path_list, fs, out_path):
     """
     import pyarrow.parquet as pq
 
-    meta = None
     out_path = out_path.rstrip("/")
-    for path in path_list:
+
+    def read_footer(path):
         assert path.startswith(out_path)
         with fs.open(path, "rb") as f:
             _meta = pq.ParquetFile(f).metadata
         _meta.set_file_path(path[len(out_path) + 1 :])
-        if meta:
-            meta.append_row_groups(_meta)
-        else:
-            meta = _meta
-    _write_metadata(fs, out_path, meta)
+        return _meta
+
+    metas = _thread_map(read_footer, path_list)
+    _metadata_file_from_metas(fs, out_path, *metas)
 
 
 def _metadata_file_from_metas(fs, out_path, *metas):
@@ -470,9 +800,6 @@ def _write_metadata(fs, out_path, meta):
     metadata_path = "/".join([out_path, "_metadata"])
     with fs.open(metadata_path, "wb") as fil:
         meta.write_metadata_file(fil)
-    metadata_path = "/".join([out_path, "_metadata"])
-    with fs.open(metadata_path, "wb") as fil:
-        meta.write_metadata_file(fil)
 
 
 class _ToParquetFn:
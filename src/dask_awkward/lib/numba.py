@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+import awkward as ak
+import numpy as np
+from dask.base import tokenize
+
+from dask_awkward.lib.core import Array, map_partitions
+
+
+@lru_cache(maxsize=None)
+def _jit(fn: Callable, cache: bool) -> Callable:
+    try:
+        import numba
+    except ImportError as err:  # pragma: no cover
+        raise ImportError(
+            "map_partitions_numba requires numba; "
+            "install it with `pip install numba`."
+        ) from err
+
+    return numba.njit(nogil=True, cache=cache)(fn)
+
+
+def _is_typetracer(obj: Any) -> bool:
+    # called for every argument of every kernel call; reading the
+    # layout's backend avoids the dispatch machinery of ak.backend.
+    return isinstance(obj, ak.Array) and obj.layout.backend.name == "typetracer"
+
+
+def _to_kernel_argument(obj: Any) -> Any:
+    if isinstance(obj, ak.Array):
+        # numba compiles a specialization for every regular size;
+        # variable length lists keep that to one per type.
+        return ak.from_regular(obj, axis=None)
+    return obj
+
+
+def _wrap_kernel_result(result: Any) -> ak.Array:
+    if isinstance(result, tuple):
+        counts, content = result
+        return ak.unflatten(np.asarray(content), np.asarray(counts))
+    return ak.Array(np.asarray(result))
+
+
+class _NumbaKernelFn:
+    def __init__(self, fn: Callable, cache: bool = False) -> None:
+        self.fn = fn
+        self.cache = cache
+
+    def __dask_tokenize__(self):
+        return ("_NumbaKernelFn", tokenize(self.fn), self.cache)
+
+    def __call__(self, *args: Any) -> ak.Array:
+        kernel = _jit(self.fn, self.cache)
+        if any(_is_typetracer(arg) for arg in args):
+            # the kernel is opaque to the typetracer: all of the
+            # inputs are needed, and the output type is found by
+            # running it on length zero arrays.
+            for arg in args:
+                if _is_typetracer(arg):
+                    ak.typetracer.touch_data(arg)
+            zero_args = [
+                (
+                    ak.typetracer.length_zero_if_typetracer(arg)
+                    if _is_typetracer(arg)
+                    else arg
+                )
+                for arg in args
+            ]
+            result = _wrap_kernel_result(kernel(*map(_to_kernel_argument, zero_args)))
+            return ak.Array(result.layout.to_typetracer(forget_length=True))
+        return _wrap_kernel_result(kernel(*map(_to_kernel_argument, args)))
+
+
+def map_partitions_numba(
+    fn: Callable,
+    *args: Any,
+    label: str | None = None,
+    meta: Any | None = None,
+    cache: bool = False,
+) -> Array:
+    """Map a Numba compiled kernel across all partitions of collections.
+
+    `fn` is compiled with ``numba.njit(nogil=True)`` once per process
+    (and, by Numba, once per combination of argument types), so the
+    per-partition cost is just the kernel itself, with the GIL
+    released while it runs. Awkward Array arguments are passed
+    directly to the kernel; regular dimensions are converted to
+    variable length lists first to avoid recompiling for each size.
+
+    Numba cannot create awkward arrays, so `fn` must return either a
+    NumPy array (becoming a flat array) or a ``(counts, content)``
+    tuple of NumPy arrays, which is passed to :func:`ak.unflatten`.
+
+    Parameters
+    ----------
+    fn : Callable
+        Pure Python function that Numba can compile in nopython mode.
+    *args : Any
+        Arguments passed to `fn`; Array collections must be
+        compatibly partitioned.
+    label : str, optional
+        Label for the Dask graph layer; if left to ``None`` (default),
+        the name of the function will be used.
+    meta : Any, optional
+        Metadata (typetracer) array for the result. If ``None`` (the
+        default), the kernel is run on length zero inputs to determine
+        the metadata.
+    cache : bool
+        Passed to ``numba.njit``; if ``True`` compiled kernels are
+        written to Numba's on-disk cache so that new worker processes
+        do not need to compile them again. Requires `fn` to be defined
+        in a file (not interactively).
+
+    Returns
+    -------
+    dask_awkward.Array
+        The new collection.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import dask_awkward as dak
+    >>> def nonzero_count(array):
+    ...     out = np.zeros(len(array), dtype=np.int64)
+    ...     for i, sublist in enumerate(array):
+    ...         for x in sublist:
+    ...             if x != 0:
+    ...                 out[i] += 1
+    ...     return out
+    >>> c = dak.from_lists([[[1, 0, 3], [4]], [[0, 6, 7], [8]]])
+    >>> dak.map_partitions_numba(nonzero_count, c).compute()
+    <Array [2, 1, 2, 1] type='4 * int64'>
+
+    """
+    return map_partitions(
+        _NumbaKernelFn(fn, cache=cache),
+        *args,
+        label=label or getattr(fn, "__name__", "numba-kernel"),
+        meta=meta,
+        traverse=False,
+    )
@@ -3,12 +3,14 @@ from __future__ import annotations
 import copy
 import logging
 import warnings
+from collections import deque
 from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, cast, no_type_check
 
 import awkward as ak
 import dask.config
 from awkward.typetracer import touch_data
+from dask.base import tokenize
 from dask.blockwise import Blockwise, fuse_roots, optimize_blockwise
 from dask.core import flatten
 from dask.highlevelgraph import HighLevelGraph
@@ -53,6 +55,23 @@ def all_optimizations(dsk: Mapping, keys: Sequence[Key], **_: Any) -> Mapping:
     if not isinstance(dsk, HighLevelGraph):
         dsk = HighLevelGraph.from_collections(str(id(dsk)), dsk, dependencies=())
 
+    # Graphs with only a handful of tasks can cost more to rewrite
+    # than to execute; only the columns optimization (which changes
+    # what is read from disk) is worth running on those.
+    threshold = dask.config.get("awkward.optimization.graph-threshold", 0)
+    if threshold and len(dsk) < threshold:
+        log.debug(
+            "Skipping graph rewrites for a graph of %d tasks "
+            "(awkward.optimization.graph-threshold is %d)",
+            len(dsk),
+            threshold,
+        )
+        which = dask.config.get("awkward.optimization.which")
+        if dask.config.get("awkward.optimization.enabled") and "columns" in which:
+            with typetracer_nochecks():
+                dsk = optimize_columns(dsk, keys)
+        return dsk
+
     # Perform dask-awkward specific optimizations.
     with typetracer_nochecks():
         dsk = optimize(dsk, keys=keys)
@@ -205,6 +224,27 @@ def optimize_columns(dsk: HighLevelGraph, keys: Sequence[Key]) -> HighLevelGraph
         New, optimized task graph with column-projected ``AwkwardInputLayer``.
 
     """
+    # dask merges the collection graphs into a new HighLevelGraph on
+    # every compute, but the layer objects are shared; a previous
+    # projection is reused only if it was made from the very same
+    # layer objects, output keys and configuration.
+    out_layer = _output_layer(dsk, keys)
+    signature = (
+        tokenize(
+            keys,
+            dask.config.get("awkward.optimization.columns-opt-formats", default=[]),
+        ),
+        dict(dsk.layers),
+    )
+    cached = getattr(out_layer, "_dak_projection", None)
+    if (
+        cached is not None
+        and cached[0][0] == signature[0]
+        and cached[0][1].keys() == signature[1].keys()
+        and all(lay is signature[1][n] for n, lay in cached[0][1].items())
+    ):
+        return cached[1]
+
     # 1. Build-and-evaluate typetracer-annotated graph
     projection_data = _prepare_buffer_projection(dsk, keys)
     if projection_data is None:
@@ -220,7 +260,22 @@ def optimize_columns(dsk: HighLevelGraph, keys: Sequence[Key]) -> HighLevelGraph
             report=layer_to_reports[name], state=state
         )
 
-    return HighLevelGraph(layers, dsk.dependencies)
+    optimized = HighLevelGraph(layers, dsk.dependencies)
+    if out_layer is not None:
+        # stored on the layer, the projection lives exactly as long
+        # as the collection that owns it.
+        out_layer._dak_projection = (signature, optimized)
+    return optimized
+
+
+def _output_layer(dsk: HighLevelGraph, keys: Sequence[Key]) -> Any:
+    if not keys:
+        return None
+    key = keys[0]
+    name = key[0] if isinstance(key, tuple) else key
+    if not isinstance(name, str):
+        return None
+    return dsk.layers.get(name)
 
 
 def _layers_with_annotation(dsk: HighLevelGraph, key: str) -> list[str]:
@@ -329,7 +384,7 @@ def rewrite_layer_chains(dsk: HighLevelGraph, keys: Sequence[Key]) -> HighLevelG
             layers[layer_key] = layer  # passthrough unchanged
             continue
         children = dependents[layer_key]
-        chain = [layer_key]
+        chain = deque([layer_key])
         current_layer_key = layer_key
         while (
             len(children) == 1
@@ -354,11 +409,11 @@ def rewrite_layer_chains(dsk: HighLevelGraph, keys: Sequence[Key]) -> HighLevelG
         ):
             # walk backwards
             layer_key = first(parents)
-            chain.insert(0, layer_key)
+            chain.appendleft(layer_key)
             all_layers.remove(layer_key)
             parents = dsk.dependencies[layer_key]
         if len(chain) > 1:
-            chains.append(chain)
+            chains.append(list(chain))
             layers[chain[-1]] = copy.copy(
                 dsk.layers[chain[-1]]
             )  # shallow copy to be mutated
@@ -375,7 +430,8 @@ def rewrite_layer_chains(dsk: HighLevelGraph, keys: Sequence[Key]) -> HighLevelG
         outlayer = layers[outkey]
         numblocks = [nb[0] for nb in layer0.numblocks.values() if nb[0] is not None][0]
         deps[outkey] = deps[chain[0]]
-        [deps.pop(ch) for ch in chain[:-1]]
+        for ch in chain[:-1]:
+            deps.pop(ch)
 
         if _dask_uses_tasks:
             all_tasks = [layer0.task]
@@ -305,7 +305,7 @@ def max(
             axis=axis,
             label="max",
             array=array,
-            reducer=_MaxFn(initial=initial),
+            reducer=ak.max if initial is None else _MaxFn(initial=initial),
             is_positional=False,
             keepdims=keepdims,
             mask_identity=mask_identity,
@@ -381,7 +381,7 @@ def min(
             axis=axis,
             label="min",
             array=array,
-            reducer=_MinFn(initial=initial),
+            reducer=ak.min if initial is None else _MinFn(initial=initial),
             is_positional=False,
             keepdims=keepdims,
             mask_identity=mask_identity,
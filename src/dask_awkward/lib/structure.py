@@ -346,13 +346,55 @@ def copy(array: Array) -> Array:
     )
 
 
+def _flat_option_numeric(array: ak.Array) -> tuple[np.ndarray, np.ndarray] | None:
+    """Data and validity mask of a one-dimensional numeric option array.
+
+    Returns ``None`` if the array is not eligible for the NumPy fast
+    paths of :func:`fill_none` and :func:`is_none`, in which case the
+    awkward function should be used.
+    """
+    layout = array.layout
+    if (
+        # awkward just drops the (never missing) option of UnmaskedArray
+        not layout.is_option
+        or isinstance(layout, ak.contents.UnmaskedArray)
+        or layout.backend.name != "cpu"
+        or layout.parameters
+        or not isinstance(layout.content, ak.contents.NumpyArray)
+        or layout.content.parameters
+        or layout.content.data.ndim != 1
+        or layout.content.data.dtype.kind not in "biuf"
+    ):
+        return None
+    bytemasked = layout.to_ByteMaskedArray(valid_when=True)
+    valid = bytemasked.mask.data.view(np.bool_)
+    return bytemasked.content.data[: len(valid)], valid
+
+
 class _FillNoneFn:
     def __init__(self, value, **kwargs):
         self.value = value
         self.kwargs = kwargs
 
     def __call__(self, arr):
-        return ak.fill_none(arr, self.value, **self.kwargs)
+        flat = None
+        if (
+            self.kwargs["axis"] in (-1, 0, None)
+            and np.ndim(self.value) == 0
+            and np.asarray(self.value).dtype.kind in "biuf"
+        ):
+            flat = _flat_option_numeric(arr)
+        if flat is None:
+            return ak.fill_none(arr, self.value, **self.kwargs)
+        data, valid = flat
+        # same type promotion as concatenating the value to the data.
+        out = data.astype(np.result_type(data, np.asarray(self.value)))
+        out[~valid] = self.value
+        return ak.Array(
+            ak.contents.NumpyArray(out),
+            behavior=self.kwargs["behavior"],
+            attrs=self.kwargs["attrs"],
+        )
 
 
 @borrow_docstring(ak.fill_none)
@@ -543,7 +585,17 @@ class _IsNoneFn:
         self.kwargs = kwargs
 
     def __call__(self, array):
-        return ak.is_none(array, **self.kwargs)
+        flat = None
+        if self.kwargs["axis"] in (-1, 0) and self.kwargs["highlevel"]:
+            flat = _flat_option_numeric(array)
+        if flat is None:
+            return ak.is_none(array, **self.kwargs)
+        _, valid = flat
+        return ak.Array(
+            ak.contents.NumpyArray(~valid),
+            behavior=self.kwargs["behavior"],
+            attrs=self.kwargs["attrs"],
+        )
 
 
 @borrow_docstring(ak.is_none)
@@ -1045,10 +1097,55 @@ class _WithFieldFn:
         self.attrs = attrs
 
     def __call__(self, base: ak.Array, what: ak.Array) -> ak.Array:
+        result = self._with_top_level_field(base, what)
+        if result is not None:
+            return result
         return ak.with_field(
             base, what, where=self.where, behavior=self.behavior, attrs=self.attrs
         )
 
+    def _with_top_level_field(self, base: ak.Array, what: Any) -> ak.Array | None:
+        # adding a field to a record array with an array of the same
+        # length needs no broadcasting; assemble the new RecordArray
+        # directly instead of going through ak.with_field.
+        where = self.where
+        if not isinstance(where, str):
+            if not (isinstance(where, (list, tuple)) and len(where) == 1):
+                return None
+            where = where[0]
+        layout = base.layout
+        if (
+            not isinstance(where, str)
+            or not isinstance(what, ak.Array)
+            or not isinstance(layout, ak.contents.RecordArray)
+            or layout.is_tuple
+            or layout.backend.name != "cpu"
+            or what.layout.backend.name != "cpu"
+            or len(what) != len(base)
+            # otherwise awkward has to merge behaviors and attributes
+            or what.attrs
+            or (what.behavior is not None and what.behavior is not base.behavior)
+        ):
+            return None
+        # an existing field is replaced by appending the new one last
+        pairs = [
+            (field, content)
+            for field, content in builtins.zip(layout.fields, layout.contents)
+            if field != where
+        ]
+        pairs.append((where, what.layout))
+        record = ak.contents.RecordArray(
+            [content for _, content in pairs],
+            [field for field, _ in pairs],
+            length=layout.length,
+            parameters=layout.parameters,
+        )
+        return ak.Array(
+            record,
+            behavior=self.behavior if self.behavior is not None else base.behavior,
+            attrs=self.attrs if self.attrs is not None else base.attrs,
+        )
+
 
 @borrow_docstring(ak.with_field)
 def with_field(
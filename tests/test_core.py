@@ -5,7 +5,7 @@ import json
 import operator
 import sys
 from collections.abc import Callable
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import awkward as ak
 import dask.array as da
@@ -13,12 +13,14 @@ import dask.config
 import fsspec
 import numpy as np
 import pytest
+from dask.base import tokenize
 from dask.delayed import delayed
 
 import dask_awkward as dak
 from dask_awkward.lib.core import (
     Record,
     Scalar,
+    _finalize_array,
     calculate_known_divisions,
     compute_typetracer,
     empty_typetracer,
@@ -49,6 +51,17 @@ def test_clear_divisions(ndjson_points_file: str) -> None:
     assert not daa.known_divisions
 
 
+def test_divisions_assignment_updates_partitions(caa: ak.Array) -> None:
+    daa = dak.from_awkward(caa, npartitions=2)
+    divisions = daa.divisions
+    daa._divisions = (None,) * (len(divisions) + 1)
+    assert daa.npartitions == len(divisions)
+    assert not daa.known_divisions
+    daa._divisions = divisions
+    assert daa.npartitions == len(divisions) - 1
+    assert daa.known_divisions
+
+
 def test_dunder_str(caa: ak.Array) -> None:
     daa = dak.from_awkward(caa, npartitions=2)
     assert str(daa) == "dask.awkward<from-awkward, npartitions=2>"
@@ -65,6 +78,25 @@ def test_calculate_known_divisions(ndjson_points_file: str) -> None:
     daa.eager_compute_divisions()
     assert daa.known_divisions
     assert calculate_known_divisions(daa) == target
+    assert all(type(d) is int for d in daa.divisions)
+
+
+def test_eager_compute_divisions_once(
+    ndjson_points_file: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    daa = dak.from_json([ndjson_points_file] * 3)
+    daa.eager_compute_divisions()
+    assert len(daa) == 15
+
+    def fail(array):
+        raise AssertionError("divisions recomputed")
+
+    monkeypatch.setattr("dask_awkward.lib.core.calculate_known_divisions", fail)
+    daa.eager_compute_divisions()
+    assert len(daa) == 15
+    daa.clear_divisions()
+    with pytest.raises(AssertionError, match="recomputed"):
+        daa.eager_compute_divisions()
 
 
 def test_fields(ndjson_points_file: str) -> None:
@@ -160,6 +192,63 @@ def test_partitions_divisions(ndjson_points_file: str) -> None:
     assert t2.divisions == (0, divs[2] - divs[1])
 
 
+def test_dask_keys_cached(daa: Array) -> None:
+    daa = daa.points
+    keys = daa.__dask_keys__()
+    assert daa.__dask_keys__() is keys
+    assert daa.keys_array.tolist() == [list(k) for k in keys]
+
+    # __setitem__ gives the collection a new name (and new keys).
+    daa["xx"] = daa.x
+    assert daa.__dask_keys__() == [(daa.name, i) for i in range(daa.npartitions)]
+    assert daa.keys_array[0, 0] == daa.name
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        1,
+        -1,
+        slice(1, None),
+        slice(None, None, -2),
+        [2, 0],
+        np.array([True, False, True]),
+    ],
+)
+def test_partitions_index_kinds(index: Any) -> None:
+    parts = [[[i]] * (i + 1) for i in range(3)]
+    daa = dak.from_lists(parts)
+    selected = np.arange(3)[index]
+    expected = ak.Array([row for i in np.atleast_1d(selected) for row in parts[i]])
+    assert_eq(daa.partitions[index], expected, check_divisions=False)
+
+
+def test_partitions_reuses_layer() -> None:
+    caa = ak.Array([[1, 2, 3], [], [4, 5], [6], [7, 8, 9, 10]])
+    daa = dak.from_awkward(caa, npartitions=2)
+    p1 = daa.partitions[1]
+    p2 = daa.partitions[1]
+    assert p1.name == p2.name
+    assert p1.dask.layers[p1.name] is p2.dask.layers[p2.name]
+    assert_eq(p2, caa[daa.divisions[1] : daa.divisions[2]])
+
+    # a persisted collection keeps its name but not its graph.
+    persisted = daa.persist()
+    p3 = persisted.partitions[1]
+    assert p3.name == p1.name
+    assert isinstance(dict(p3.dask)[(daa.name, 1)], ak.Array)
+    assert_eq(p3, p1)
+
+
+def test_collection_names_tokenize_collection(caa: ak.Array) -> None:
+    # collections tokenize to their name, so tokenizing the name
+    # directly must give the same graph keys.
+    daa = dak.from_awkward(caa, npartitions=2)
+    assert daa.partitions[1].name == f"partitions-{tokenize(daa, (1,))}"
+    record = daa[0]
+    assert record["points"].name == f"points-{tokenize(record, 'points')}"
+
+
 def test_array_rebuild(ndjson_points_file: str) -> None:
     daa = dak.from_json([ndjson_points_file])
     x = daa.compute()
@@ -175,6 +264,19 @@ def test_type(ndjson_points_file: str) -> None:
     assert dak.type(daa) is None
 
 
+def test_type_cached(daa: Array) -> None:
+    t = dak.type(daa)
+    assert dak.type(daa) is t
+    assert daa.type.content is t
+
+    # replacing the metadata invalidates the cached type.
+    daa = daa.points
+    daa["w"] = daa.x
+    assert "w" in str(dak.type(daa))
+    daa.reset_meta()
+    assert str(dak.type(daa)) == "unknown"
+
+
 def test_short_typestr(daa: Array) -> None:
     ts = daa._shorttypestr(max=12)
     assert len(ts) == 12
@@ -187,6 +289,31 @@ def test_typestr(daa: Array) -> None:
     assert len(daa._typestr(max=20)) == 20 + extras
 
 
+def test_finalize_array_results() -> None:
+    assert _finalize_array([np.int64(1), np.int64(2)]).tolist() == [1, 2]
+    assert _finalize_array([np.array(1.5), np.array(2.5)]).tolist() == [1.5, 2.5]
+    assert _finalize_array([3, 4]).tolist() == [3, 4]
+    assert _finalize_array([None, None]) is None
+    assert _finalize_array([None]) is None
+    parts = [ak.Array([1]), ak.Array([2, 3])]
+    assert _finalize_array(parts).tolist() == [1, 2, 3]
+    with pytest.raises(RuntimeError, match="Unexpected results"):
+        _finalize_array(["a", "b"])
+
+
+def test_compute_mostly_empty_partitions() -> None:
+    caa = ak.Array([{"x": [i] * (i % 3), "y": float(i)} for i in range(40)])
+    daa = dak.from_awkward(caa, npartitions=10)
+    selected = daa[daa.y > 33]
+    result = selected.compute()
+    assert result.tolist() == caa[caa.y > 33].tolist()
+    assert result.type == caa[caa.y > 33].type
+
+    none = daa[daa.y < 0].compute()
+    assert len(none) == 0
+    assert none.type == caa[caa.y < 0].type
+
+
 def test_head(daa: Array) -> None:
     out = daa.head(1)
     assert out.tolist() == daa.compute()[:1].tolist()
@@ -202,6 +329,8 @@ def test_head(daa: Array) -> None:
     out = daa.head(1, compute=False)
     assert isinstance(out, dak.lib.Array)
     assert out.divisions == (0, 1)
+    assert daa.head(1, compute=False).name == out.name
+    assert daa.head(2, compute=False).name != out.name
 
 
 def test_record_collection(daa: Array) -> None:
@@ -293,6 +422,12 @@ def test_getitem_zero_slice_single(daa: Array, where: slice) -> None:
     assert len(out) == len(daa.compute()[where])
 
 
+@pytest.mark.parametrize("where", [7, np.int64(7), np.uint8(7), True])
+def test_getitem_integer_kinds(daa: Array, where: int) -> None:
+    # integers that are not exactly `int` miss the dispatch table
+    assert daa[where].compute().tolist() == daa.compute()[int(where)].tolist()
+
+
 @pytest.mark.parametrize(
     "where",
     [
@@ -430,6 +565,16 @@ def test_array_dir(daa: Array) -> None:
         assert f in d
 
 
+def test_array_dir_non_identifier_fields() -> None:
+    caa = ak.Array([{"x": 1, "not valid": 2, "class": 3, "y2": 4}])
+    daa = dak.from_awkward(caa, npartitions=1)
+    d = dir(daa)
+    assert {"x", "y2"} <= set(d)
+    assert "not valid" not in d
+    assert "class" not in d
+    assert dir(daa) == d
+
+
 def test_typetracer_function(daa: Array) -> None:
     aa = daa.compute()
     assert typetracer_array(daa) is not None
@@ -441,6 +586,15 @@ def test_typetracer_function(daa: Array) -> None:
         typetracer_array(3)
 
 
+def test_empty_typetracer_not_shared() -> None:
+    a = empty_typetracer()
+    b = empty_typetracer()
+    assert a is not b
+    assert is_typetracer(a)
+    a.attrs = {"origin": "test"}
+    assert b.attrs == {}
+
+
 def test_single_partition(ndjson_points_file: str) -> None:
     daa = dak.from_json([ndjson_points_file])
     with fsspec.open(ndjson_points_file, "r") as f:
@@ -711,6 +865,13 @@ def test_normalize_single_outer_inner_index() -> None:
         res = normalize_single_outer_inner_index(divisions, i)
         assert r == res
 
+    # negative indices count from the end; empty partitions are skipped.
+    assert normalize_single_outer_inner_index(divisions, -1) == (4, 0)
+    assert normalize_single_outer_inner_index((0, 3, 3, 6), 3) == (2, 0)
+    res = normalize_single_outer_inner_index(divisions, np.int64(13))
+    assert res == (1, 1)
+    assert all(type(x) is int for x in res)
+
     divisions = (0, 12)  # type: ignore
     indices = [0, 2, 3, 6, 8, 11]
     results = [
@@ -885,6 +1046,20 @@ def test_map_partitions_no_dask_collections_passed(caa):
         dak.num(caa.points.x, axis=1)
 
 
+def _add_n(x, n=1):
+    return x + n
+
+
+def test_map_partitions_deterministic_name(daa: Array, caa: ak.Array) -> None:
+    x = daa.points.x
+    a = dak.map_partitions(_add_n, x, n=2)
+    assert a.name == dak.map_partitions(_add_n, x, n=2).name
+    assert "add-n-" in a.name
+    assert a.name != dak.map_partitions(_add_n, x, n=3).name
+    assert a.name != dak.map_partitions(_add_n, x, n=2, meta=x._meta).name
+    assert_eq(a, caa.points.x + 2)
+
+
 @pytest.mark.parametrize("fn", [dak.count, dak.zeros_like, dak.ones_like])
 def test_shape_only_ops(fn: Callable, tmp_path_factory: pytest.TempPathFactory) -> None:
     pytest.importorskip("pyarrow")
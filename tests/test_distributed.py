@@ -84,6 +84,17 @@ def test_from_delayed(loop, ndjson_points_file):  # noqa
             assert_eq(x, y, scheduler=client)
 
 
+def test_from_map_futures(loop, ndjson_points_file):  # noqa
+    files = [ndjson_points_file] * 3
+    y = ak.concatenate([make_a_concrete(f) for f in files])
+    with cluster() as (s, [a, b]):
+        with Client(s["address"], loop=loop) as client:
+            x = dak.from_map(make_a_concrete, files, execute_mode="futures")
+            assert all(isinstance(v, distributed.Future) for v in dict(x.dask).values())
+            assert_eq(x, y, scheduler=client)
+            assert_eq(x.points.x, y.points.x, scheduler=client)
+
+
 behaviors: dict = {}
 
 
@@ -211,3 +211,27 @@ def test_multiarg_starting_with_string_gh454(i):
 
     assert_eq(daa[["a", "b"], i], caa[["a", "b"], i])
     assert_eq(daa[i, ["a", "b"]], caa[["a", "b"], i])
+
+
+def test_getitem_dispatch_subclasses(daa: dak.Array, caa: ak.Array) -> None:
+    class Fields(list):
+        pass
+
+    class Where(tuple):
+        pass
+
+    assert_eq(daa[Fields(["points"])], caa[["points"]])
+    assert_eq(daa[Where(("points", "x"))], caa["points", "x"])
+    assert daa[...] is daa
+    with pytest.raises(RuntimeError, match="Lists containing integers"):
+        daa[Fields([0, 1])]
+
+
+@pytest.mark.parametrize("where", [slice(19, None), slice(20, 45, 3), slice(-5, None)])
+def test_slice_on_zero_skips_leading_partitions(where: slice) -> None:
+    caa = ak.Array([[i] * (i % 3) for i in range(50)])
+    bounds = [0, 7, 7, 20, 33, 50]
+    daa = dak.from_lists([caa[i:j].tolist() for i, j in zip(bounds, bounds[1:])])
+    result = daa[where]
+    assert result.divisions[-1] == len(caa[where])
+    assert_eq(result, caa[where])
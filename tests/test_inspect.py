@@ -117,3 +117,8 @@ def test_sample(daa):
     arr = out.compute()
     assert 1 <= len(arr) <= 14
     assert all(a in daa.compute().tolist() for a in arr.tolist())
+
+
+def test_sample_factor_deterministic_name(daa):
+    assert dak.sample(daa, factor=3).name == dak.sample(daa, factor=3).name
+    assert dak.sample(daa, factor=3).name != dak.sample(daa, factor=2).name
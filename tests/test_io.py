@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 from pathlib import Path
 from typing import cast
 
@@ -8,6 +9,7 @@ import dask
 import numpy as np
 import pytest
 from dask.array.utils import assert_eq as da_assert_eq
+from dask.base import tokenize
 from dask.delayed import delayed
 from fsspec.core import get_fs_token_paths
 from numpy.typing import DTypeLike
@@ -157,6 +159,10 @@ def test_from_map_enumerate() -> None:
     a2 = ak.Array([{"x": [1, 2, 3]}, {"x": [4, 5, 6, 4, 5, 6]}])
     assert_eq(a1, a2)
 
+    # without a distributed client the futures mode builds a graph.
+    a3 = dak.from_map(f, enumerate(x), execute_mode="futures")
+    assert_eq(a3, a2)
+
 
 def test_from_map_exceptions() -> None:
     def f(a, b):
@@ -177,6 +183,9 @@ def test_from_map_exceptions() -> None:
     with pytest.raises(ValueError, match="at least one Iterable input"):
         dak.from_map(f, args=(5,))
 
+    with pytest.raises(ValueError, match="execute_mode must be"):
+        dak.from_map(f, [1], [2], execute_mode="eager")
+
 
 def test_from_map_raise_produces_tasks() -> None:
     def f(a, b):
@@ -186,6 +195,22 @@ def test_from_map_raise_produces_tasks() -> None:
         dak.from_map(f, [1, 2, 3], [4, 5, 6], produces_tasks=True)
 
 
+@pytest.mark.parametrize(
+    "lists",
+    [
+        [[[1, 2, 3], [], [4]], [[5, 6]]],
+        [[[1.5, 2], []], [[3], [4, 5.5]]],
+        [[[True], [False]], [[True]]],
+        [[[1, None], [2]], [[3]]],
+        [[{"x": 1}], [{"x": 2}]],
+    ],
+)
+def test_from_lists_fast_path(lists: list) -> None:
+    daa = dak.from_lists(lists)
+    caa = ak.Array(list(itertools.chain.from_iterable(lists)))
+    assert_eq(daa, caa)
+
+
 def test_from_lists(caa_p1: ak.Array) -> None:
     listed = caa_p1.tolist()
     one = listed[:5]
@@ -211,6 +236,7 @@ def test_to_dask_array_multidim() -> None:
     c = ak.Array([[[1, 2, 3]], [[4, 5, 6]]])
     a = dak.from_awkward(c, npartitions=2)
     d = dak.to_dask_array(a)
+    assert d.chunks[0] == (1, 1)
     da_assert_eq(d, ak.to_numpy(c))
 
 
@@ -231,6 +257,21 @@ def test_to_dask_array_divs(
     da_assert_eq(c, d)
 
 
+def test_to_dask_array_flat_views() -> None:
+    c = ak.Array(np.arange(10, dtype=np.int64))
+    a = dak.from_awkward(c, npartitions=3)
+    (part,) = dask.compute(a.to_dask_array().blocks[1])
+    assert np.shares_memory(part, c.layout.data)
+
+    u = dak.from_awkward(c, npartitions=3)
+    u = dak.map_partitions(
+        lambda x: ak.Array(ak.contents.UnmaskedArray(x.layout)), u, label="unmask"
+    )
+    d = dak.to_dask_array(u, dtype=np.float32)
+    da_assert_eq(d, np.arange(10, dtype=np.float32))
+    assert not isinstance(d.compute(), np.ma.MaskedArray)
+
+
 @pytest.mark.parametrize("optimize_graph", [True, False])
 def test_to_delayed(daa, caa, optimize_graph):
     delayeds = dak.to_delayed(daa.points, optimize_graph=optimize_graph)
@@ -287,6 +328,25 @@ def test_to_dataframe_str(
     assert_eq(dd, df, check_index=False)
 
 
+def test_from_awkward_input_dep_token(caa: ak.Array) -> None:
+    a = dak.from_awkward(caa, npartitions=3)
+    b = dak.from_awkward(caa, npartitions=3)
+    c = dak.from_awkward(caa, npartitions=2)
+    deps = [first(x.dask.layers[x.name].io_deps.values()) for x in (a, b, c)]
+    assert tokenize(deps[0]) == tokenize(deps[1])
+    assert tokenize(deps[0]) != tokenize(deps[2])
+    assert_eq(a, caa)
+
+
+def test_from_awkward_partitions_are_views() -> None:
+    source = ak.Array(np.arange(10))
+    daa = dak.from_awkward(source, npartitions=2, attrs={"origin": "test"})
+    part = daa.partitions[1].compute()
+    assert part.tolist() == list(range(5, 10))
+    assert part.attrs == {"origin": "test"}
+    assert np.shares_memory(ak.to_numpy(part), ak.to_numpy(source))
+
+
 def test_from_awkward_empty_array(daa: dak.Array) -> None:
     # no form
     c1 = ak.Array([])
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 import os
+import pickle
+import warnings
 from pathlib import Path
 
 import awkward as ak
@@ -12,6 +14,7 @@ import pytest
 import dask_awkward as dak
 from dask_awkward.layers import _dask_uses_tasks
 from dask_awkward.lib.core import Array
+from dask_awkward.lib.io.json import json_meta_cache
 from dask_awkward.lib.optimize import optimize as dak_optimize
 from dask_awkward.lib.testutils import assert_eq
 
@@ -167,6 +170,132 @@ def test_json_bytes_no_delim_defined(ndjson_points_file: str) -> None:
     assert_eq(daa, caa)
 
 
+def test_json_bytes_blocksize_spellings(ndjson_points_file: str) -> None:
+    a = dak.from_json(ndjson_points_file, blocksize="1 KiB")
+    b = dak.from_json(ndjson_points_file, blocksize=1024)
+    assert a.name == b.name
+
+
+def test_json_bytes_single_file(ndjson_points_file: str) -> None:
+    daa = dak.from_json(ndjson_points_file, blocksize=100)
+    assert daa.npartitions > 1
+    caa = ak.from_json(Path(ndjson_points_file), line_delimited=True)
+    assert_eq(daa, caa)
+
+
+def test_json_streamed_small_buffersize(ndjson_points_file: str) -> None:
+    # files are streamed to the parser; a buffer smaller than a line
+    # requires many reads per file.
+    daa = dak.from_json([ndjson_points_file] * 2, buffersize=16)
+    caa = ak.from_json(Path(ndjson_points_file), line_delimited=True)
+    assert_eq(daa, ak.concatenate([caa, caa]))
+
+
+def test_json_aggregate_files(json_data_dir: Path, concrete_data: ak.Array) -> None:
+    daa = dak.from_json(json_data_dir / "*.json", aggregate_files="1 MiB")
+    assert daa.npartitions == 1
+    assert_eq(daa, concrete_data, check_forms=False, check_divisions=False)
+
+    daa = dak.from_json(json_data_dir / "*.json", aggregate_files=1)
+    assert daa.npartitions == 3
+    assert_eq(daa, concrete_data, check_forms=False, check_divisions=False)
+
+    with pytest.raises(ValueError, match="aggregate_files"):
+        dak.from_json(json_data_dir, aggregate_files=1, blocksize=100)
+    with pytest.raises(ValueError, match="aggregate_files"):
+        dak.from_json(json_data_dir, aggregate_files=1, delimiter=b"\n")
+
+
+def test_json_files_per_partition(json_data_dir: Path, concrete_data: ak.Array) -> None:
+    daa = dak.from_json(json_data_dir / "*.json", files_per_partition=2)
+    assert daa.npartitions == 2
+    assert_eq(daa, concrete_data, check_forms=False, check_divisions=False)
+
+    with pytest.raises(ValueError, match="files_per_partition"):
+        dak.from_json(json_data_dir, files_per_partition=2, aggregate_files=1)
+    with pytest.raises(ValueError, match="files_per_partition"):
+        dak.from_json(json_data_dir, files_per_partition=2, delimiter=b"\n")
+    with pytest.raises(ValueError, match="files_per_partition"):
+        dak.from_json(json_data_dir, files_per_partition=0)
+
+
+def test_json_sopf_files_per_partition(single_record_file: str) -> None:
+    daa = dak.from_json(
+        [single_record_file] * 5, line_delimited=False, files_per_partition=2
+    )
+    assert daa.npartitions == 3
+    single_record = ak.from_json(Path(single_record_file), line_delimited=False)
+    assert_eq(daa, ak.Array([single_record] * 5), check_divisions=False)
+
+
+def test_json_sopf_aggregate_files(single_record_file: str) -> None:
+    daa = dak.from_json(
+        [single_record_file] * 4, line_delimited=False, aggregate_files="1 MiB"
+    )
+    assert daa.npartitions == 1
+    single_record = ak.from_json(Path(single_record_file), line_delimited=False)
+    assert_eq(daa, ak.Array([single_record] * 4), check_divisions=False)
+
+
+def test_json_sopf_blocksize_warns(single_record_file: str) -> None:
+    with pytest.warns(UserWarning, match="blocksize is ignored"):
+        daa = dak.from_json(
+            [single_record_file] * 2, line_delimited=False, blocksize=100
+        )
+    assert daa.npartitions == 2
+
+    # a delimiter alone does not count as a blocksize from the caller
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        daa = dak.from_json(
+            [single_record_file] * 2, line_delimited=False, delimiter=b"\n"
+        )
+    assert daa.npartitions == 2
+
+
+def test_json_meta_cached(tmp_path: Path) -> None:
+    json_meta_cache.clear()
+    path = tmp_path / "data.json"
+    path.write_text(data1)
+    first = dak.from_json(path, blocksize=None, delimiter=None)
+    second = dak.from_json(path, blocksize=None, delimiter=None)
+    assert len(json_meta_cache) == 1
+    assert second.form == first.form
+
+    # a modified file is sampled again.
+    path.write_text(data2 + data3)
+    dak.from_json(path, blocksize=None, delimiter=None)
+    assert len(json_meta_cache) == 2
+
+
+def test_json_meta_sample_rows_compressed(tmp_path: Path) -> None:
+    path = str(tmp_path / "data.json.gz")
+    with fsspec.open(path, mode="wt", compression="gzip") as f:
+        f.write('{"a": 1}\n{"a": 2}\n{"a": 3, "b": 1}\n')
+    daa = dak.from_json(path, blocksize=None, delimiter=None, meta_sample_rows=2)
+    assert daa.fields == ["a"]
+    daa = dak.from_json(path, blocksize=None, delimiter=None, meta_sample_rows=3)
+    assert daa.fields == ["a", "b"]
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"blocksize": 650}, {"line_delimited": False}])
+def test_json_behavior_and_attrs(
+    ndjson_points_file: str,
+    single_record_file: str,
+    kwargs: dict,
+) -> None:
+    behavior = {"__doc__": "custom"}
+    attrs = {"origin": "test"}
+    if kwargs.get("line_delimited", True):
+        source = ndjson_points_file
+    else:
+        source = single_record_file
+    daa = dak.from_json([source] * 2, behavior=behavior, attrs=attrs, **kwargs)
+    for part in dask.compute(*[daa.partitions[i] for i in range(daa.npartitions)]):
+        assert part.behavior == behavior
+        assert part.attrs == attrs
+
+
 @pytest.mark.parametrize("compression", [None, "xz"])
 def test_json_one_obj_per_file(
     single_record_file: str,
@@ -221,3 +350,12 @@ def test_to_and_from_json(
     suffix = "gz" if compression == "gzip" else compression
     r = dak.from_json(os.path.join(tdir, f"*.json.{suffix}"))
     assert_eq(x, r)
+
+
+def test_to_json_graph_pickles(daa: Array, tmp_path: Path) -> None:
+    s = dak.to_json(daa, str(tmp_path / "out"), compute=False)
+    # the finalize task holds no local functions.
+    finalize = pickle.loads(pickle.dumps(dict(s.dask.layers[s.name])))
+    assert list(finalize) == [(s.name, 0)]
+    s.compute()
+    assert len(list((tmp_path / "out").glob("part*.json"))) == daa.npartitions
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import awkward as ak
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+
+import dask_awkward as dak
+from dask_awkward.lib.testutils import assert_eq
+
+
+def nonzero_count(array):
+    out = np.zeros(len(array), dtype=np.int64)
+    for i, sublist in enumerate(array):
+        for x in sublist:
+            if x != 0:
+                out[i] += 1
+    return out
+
+
+def doubled_x(array):
+    counts = np.zeros(len(array), dtype=np.int64)
+    content = []
+    for i, record in enumerate(array):
+        for x in record.x:
+            content.append(2.0 * x)
+            counts[i] += 1
+    return counts, np.array(content)
+
+
+def test_map_partitions_numba_flat(daa: dak.Array, caa: ak.Array) -> None:
+    result = dak.map_partitions_numba(nonzero_count, daa.points.x)
+    assert result.npartitions == daa.npartitions
+    assert_eq(result, ak.count_nonzero(caa.points.x, axis=1), check_divisions=False)
+
+
+def test_map_partitions_numba_unflatten() -> None:
+    caa = ak.Array([{"x": [1, 2], "y": 1}, {"x": [], "y": 2}, {"x": [3], "y": 3}])
+    daa = dak.from_awkward(caa, npartitions=2)
+    result = dak.map_partitions_numba(doubled_x, daa)
+    assert result._meta.type.content == ak.types.ListType(ak.types.NumpyType("float64"))
+    assert_eq(result, 2.0 * caa.x, check_divisions=False, check_forms=False)
+
+
+def test_map_partitions_numba_regular() -> None:
+    caa = ak.to_regular(ak.Array([[1, 0, 3], [0, 0, 4]]), axis=1)
+    daa = dak.from_awkward(caa, npartitions=2)
+    result = dak.map_partitions_numba(nonzero_count, daa)
+    assert result.compute().tolist() == [2, 1]
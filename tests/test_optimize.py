@@ -3,8 +3,10 @@ from __future__ import annotations
 import awkward as ak
 import dask
 import pytest
+from dask.highlevelgraph import HighLevelGraph
 
 import dask_awkward as dak
+from dask_awkward.lib.optimize import optimize_columns, rewrite_layer_chains
 from dask_awkward.lib.testutils import assert_eq
 
 
@@ -153,3 +155,64 @@ def test_optimization_runs_on_multiple_collections_gh430(tmp_path_factory):
     assert str(x)
     assert str(y)
     assert str(z)
+
+
+def test_map_partitions_chain_fused(daa: dak.Array, caa: ak.Array) -> None:
+    result = daa.points.x
+    expected = caa.points.x
+    for _ in range(10):
+        result = dak.map_partitions(lambda x: x + 1, result)
+        expected = expected + 1
+    assert len(result.dask.layers) > 10
+
+    # the whole chain, including the input layer, runs as one task
+    # per partition after optimization.
+    (dsk,) = dask.optimize(result)
+    assert len(dict(dsk.dask)) == daa.npartitions
+    assert_eq(result, expected)
+
+
+def test_graph_threshold(daa: dak.Array, caa: ak.Array) -> None:
+    result = daa.points.x + 1
+    n_tasks = len(result.dask)
+    with dask.config.set({"awkward.optimization.graph-threshold": n_tasks + 1}):
+        (dsk,) = dask.optimize(result)
+        assert len(dict(dsk.dask)) == n_tasks
+        assert_eq(result, caa.points.x + 1)
+    with dask.config.set({"awkward.optimization.graph-threshold": n_tasks}):
+        (dsk,) = dask.optimize(result)
+        assert len(dict(dsk.dask)) == daa.npartitions
+
+
+def test_rewrite_layer_chains_long_chain(daa: dak.Array, caa: ak.Array) -> None:
+    result = daa.points.x
+    expected = caa.points.x
+    for _ in range(200):
+        result = result + 1
+    expected = expected + 200
+    dsk = rewrite_layer_chains(result.dask, result.__dask_keys__())
+    # the input layer and all 202 layers after it form one chain
+    assert len(dsk.layers) == 1
+    assert_eq(result, expected)
+
+
+def test_optimize_columns_cached(ndjson_points_file: str) -> None:
+    ds = dak.from_json([ndjson_points_file] * 2)
+    x = ds.points.x
+    opts = {"awkward.optimization.columns-opt-formats": ["json"]}
+    with dask.config.set(opts):
+        first = optimize_columns(x.dask, x.keys)
+        # a new graph made of the same layers (as dask.compute builds).
+        merged = HighLevelGraph.merge(x.dask)
+        assert merged is not x.dask
+        assert optimize_columns(merged, x.keys) is first
+
+    # the projection depends on which formats are optimized.
+    with dask.config.set({"awkward.optimization.columns-opt-formats": []}):
+        assert optimize_columns(x.dask, x.keys) is not first
+
+    # same layer names, different layer objects: not reused.
+    y = dak.from_json([ndjson_points_file] * 2).points.x
+    assert y.name == x.name
+    with dask.config.set(opts):
+        assert optimize_columns(y.dask, y.keys) is not first
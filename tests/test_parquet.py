@@ -15,7 +15,11 @@ import pyarrow as pa
 import pyarrow.dataset as pad
 
 import dask_awkward as dak
-from dask_awkward.lib.io.parquet import _metadata_file_from_data_files, to_parquet
+from dask_awkward.lib.io.parquet import (
+    _metadata_file_from_data_files,
+    parquet_meta_cache,
+    to_parquet,
+)
 from dask_awkward.lib.testutils import assert_eq
 
 data = [[1, 2, 3], [4, None], None]
@@ -144,6 +148,132 @@ def test_columns(tmpdir):
     assert arr3.arr.arr.fields == ["b"]
 
 
+@pytest.mark.parametrize("split_row_groups", [True, False])
+def test_column_projection_list_element(tmpdir, split_row_groups):
+    import pyarrow.parquet as pq
+
+    path = str(tmpdir / "compliant.parquet")
+    array = ak.Array([{"a": [1, 2], "b": [{"x": 1.0}]}, {"a": [], "b": []}] * 5)
+    pq.write_table(
+        ak.to_arrow_table(array),
+        path,
+        row_group_size=3,
+        use_compliant_nested_type=True,
+    )
+    arr = dak.from_parquet(path, split_row_groups=split_row_groups)
+    assert_eq(arr.b.x, array.b.x, check_forms=False)
+    assert_eq(arr.a, array.a, check_forms=False)
+
+
+@pytest.mark.parametrize("split_row_groups", [True, False])
+def test_filters(tmpdir, split_row_groups):
+    tmpdir = str(tmpdir)
+    array = ak.Array(
+        [{"x": i, "y": [i] * (i % 3), "r": {"z": 2 * i}} for i in range(10)]
+    )
+    ak.to_parquet(array[:6], f"{tmpdir}/part0.parquet", row_group_size=3)
+    ak.to_parquet(array[6:], f"{tmpdir}/part1.parquet", row_group_size=3)
+
+    arr = dak.from_parquet(
+        tmpdir, filters=[("x", ">", 4)], split_row_groups=split_row_groups
+    )
+    # the first row group cannot match and is skipped entirely
+    assert arr.npartitions == (3 if split_row_groups else 2)
+    assert not arr.known_divisions
+    assert_eq(arr, array[array.x > 4], check_forms=False, check_divisions=False)
+    assert_eq(arr.y, array.y[array.x > 4], check_forms=False, check_divisions=False)
+
+    arr = dak.from_parquet(
+        tmpdir,
+        filters=[[("r.z", "<", 3)], [("x", "in", [8])]],
+        split_row_groups=split_row_groups,
+    )
+    assert arr.x.compute().tolist() == [0, 1, 8]
+
+    arr = dak.from_parquet(tmpdir, filters=[("x", ">", 100)])
+    assert arr.npartitions == 1
+    assert arr.compute().tolist() == []
+
+    with pytest.raises(ValueError, match="not a column"):
+        dak.from_parquet(tmpdir, columns=["y"], filters=[("x", "==", 1)])
+    with pytest.raises(ValueError, match="Unsupported filter operator"):
+        dak.from_parquet(tmpdir, filters=[("x", "~", 1)])
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        [("x", "not in", [1, 4])],
+        [("x", "in", [1, 4])],
+        [("x", "!=", 1)],
+        [[("x", ">", 3)], [("y", "not in", [0.0])]],
+    ],
+)
+def test_filters_with_nulls(tmpdir, filters):
+    import pyarrow.parquet as pq
+
+    tmpdir = str(tmpdir)
+    array = ak.Array(
+        [{"x": None if i % 3 == 0 else i, "y": float(i % 2)} for i in range(8)]
+    )
+    ak.to_parquet(array, f"{tmpdir}/part0.parquet", row_group_size=4)
+
+    # rows with a null value are filtered exactly as pyarrow does
+    expected = pq.read_table(tmpdir, filters=filters).to_pylist()
+    assert dak.from_parquet(tmpdir, filters=filters).compute().tolist() == expected
+
+
+@pytest.mark.parametrize("split_row_groups", [True, False])
+def test_filters_with_report(tmpdir, split_row_groups):
+    tmpdir = str(tmpdir)
+    array = ak.Array([{"x": i, "y": float(i)} for i in range(10)])
+    ak.to_parquet(array, f"{tmpdir}/part0.parquet", row_group_size=5)
+
+    arr, report = dak.from_parquet(
+        tmpdir,
+        filters=[("x", ">", 6)],
+        split_row_groups=split_row_groups,
+        report=True,
+    )
+    c_arr, c_report = dask.compute(arr.y, report)
+    assert c_arr.tolist() == [7.0, 8.0, 9.0]
+    assert len(c_report) == 1
+    assert c_report.exception.tolist() == [None]
+
+
+def test_optimize_ahead_of_time(tmpdir):
+    arr = ak.Array([{"a": i, "b": {"c": float(i), "d": [i] * i}} for i in range(10)])
+    ak.to_parquet(arr, tmpdir + "/x.parquet")
+    result = dak.from_parquet(str(tmpdir)).b.c + 1
+    (optimized,) = dask.optimize(result)
+    with dask.config.set({"awkward.optimization.enabled": False}):
+        assert_eq(optimized, arr.b.c + 1, check_forms=False)
+
+
+def test_aggregate_files(tmpdir):
+    tmpdir = str(tmpdir)
+    arrays = [ak.Array([{"x": i, "y": [i] * (i + 1)}] * 3) for i in range(5)]
+    for i, array in enumerate(arrays):
+        ak.to_parquet(array, f"{tmpdir}/part{i}.parquet")
+
+    arr = dak.from_parquet(tmpdir, aggregate_files="1 MiB")
+    assert arr.npartitions == 1
+    assert_eq(arr, ak.concatenate(arrays), check_divisions=False)
+    assert_eq(arr.y, ak.concatenate(arrays).y, check_divisions=False)
+
+    arr = dak.from_parquet(tmpdir, aggregate_files=1)
+    assert arr.npartitions == 5
+
+    # files without a matching row group are skipped before aggregating
+    arr = dak.from_parquet(tmpdir, aggregate_files="1 MiB", filters=[("x", ">", 1)])
+    assert arr.npartitions == 1
+    expected = ak.concatenate(arrays[2:])
+    assert_eq(arr, expected, check_forms=False, check_divisions=False)
+
+    with pytest.raises(ValueError, match="aggregate_files"):
+        dak.from_parquet(tmpdir, aggregate_files=1, split_row_groups=True)
+
+
 def test_write_simple(tmpdir):
     import os
 
@@ -214,3 +344,38 @@ def test_from_parquet_with_report(
     c_ds, c_report = dask.compute(dak.max(ds.points.x, axis=1), report)
     assert len(c_ds)
     assert c_report.columns.tolist()[0] == ["points.list.item.x"]
+
+
+def test_metadata_cached(tmpdir):
+    tmpdir = str(tmpdir)
+    pad.write_dataset(ds, tmpdir, format="parquet")
+    parquet_meta_cache.clear()
+    a = dak.from_parquet(tmpdir)
+    b = dak.from_parquet(tmpdir)
+    assert len(parquet_meta_cache) == 1
+    assert a.form == b.form
+
+    # rewriting a file invalidates the entry.
+    pad.write_dataset(
+        ds_deep, tmpdir, format="parquet", existing_data_behavior="overwrite_or_ignore"
+    )
+    c = dak.from_parquet(tmpdir)
+    assert len(parquet_meta_cache) == 2
+    assert c.form != a.form
+
+
+@pytest.mark.parametrize("scan_files", [True, False])
+def test_metadata_cache_key_parsed_files_only(tmpdir, monkeypatch, scan_files):
+    tmpdir = str(tmpdir)
+    for i in range(3):
+        ak.to_parquet(ak.Array({"x": [i, i + 1]}), f"{tmpdir}/part{i}.parquet")
+    ukeys = []
+    ukey = type(fs).ukey
+    monkeypatch.setattr(
+        type(fs), "ukey", lambda self, path: ukeys.append(path) or ukey(self, path)
+    )
+    parquet_meta_cache.clear()
+    arr = dak.from_parquet(tmpdir, scan_files=scan_files)
+    # without scanning, only the footer of the first file is read.
+    assert len(ukeys) == (3 if scan_files else 1)
+    assert arr.x.compute().tolist() == [0, 1, 1, 2, 2, 3]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import awkward as ak
+import numpy as np
 import pytest
 
 import dask_awkward as dak
@@ -177,6 +178,14 @@ def test_mean(daa: dak.Array, caa: ak.Array, axis: int, attr: str) -> None:
     assert_eq(ar, dr, isclose_equal_nan=True)
 
 
+def test_float32_reductions_keep_dtype() -> None:
+    caa = ak.Array(np.linspace(0, 1, 1000, dtype=np.float32))
+    daa = dak.from_awkward(caa, npartitions=4)
+    total = dak.sum(daa, axis=0).compute()
+    assert total.dtype == np.float32
+    assert total == pytest.approx(ak.sum(caa, axis=0))
+
+
 @pytest.mark.parametrize("axis", [None, 1, -1])
 @pytest.mark.parametrize("attr", ["x", "y"])
 def test_min(daa: dak.Array, caa: ak.Array, axis: int, attr: str) -> None:
@@ -207,3 +216,43 @@ def test_std(daa: dak.Array, caa: ak.Array, axis: int, attr: str) -> None:
     ar = ak.std(caa.points[attr], axis=axis)
     dr = dak.std(daa.points[attr], axis=axis)
     assert_eq(ar, dr, isclose_equal_nan=True)
+
+
+@pytest.mark.parametrize(
+    "reducer", ["sum", "prod", "max", "min", "any", "all", "count_nonzero"]
+)
+@pytest.mark.parametrize("axis", [0, None])
+@pytest.mark.parametrize("keepdims", [True, False])
+@pytest.mark.parametrize("mask_identity", [True, False])
+@pytest.mark.parametrize("dtype", ["bool", "int32", "uint8", "float32"])
+def test_flat_numeric_reducers(
+    reducer: str, axis: int | None, keepdims: bool, mask_identity: bool, dtype: str
+) -> None:
+    caa = ak.values_astype(ak.Array([1, 0, 3, 2, 5, 4, 1, 2]), dtype)
+    daa = dak.from_awkward(caa, npartitions=3)
+    ar = getattr(ak, reducer)(
+        caa, axis=axis, keepdims=keepdims, mask_identity=mask_identity
+    )
+    dr = getattr(dak, reducer)(
+        daa, axis=axis, keepdims=keepdims, mask_identity=mask_identity
+    )
+    assert_eq(ar, dr)
+
+
+@pytest.mark.parametrize("reducer", ["max", "min"])
+@pytest.mark.parametrize(
+    "data",
+    [
+        [1.0, np.nan, 3.0, 2.0],
+        [np.nan, 1.0, 3.0, np.nan],
+        [np.nan, np.nan, 3.0, 2.0],
+        [np.nan, np.nan, np.nan, np.nan],
+    ],
+)
+def test_flat_minmax_skip_nan(reducer: str, data: list[float]) -> None:
+    caa = ak.Array(np.array(data))
+    daa = dak.from_awkward(caa, npartitions=2)
+    for axis in (0, None):
+        ar = getattr(ak, reducer)(caa, axis=axis)
+        dr = getattr(dak, reducer)(daa, axis=axis).compute()
+        assert dr == ar
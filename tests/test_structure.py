@@ -7,6 +7,7 @@ import numpy as np
 import pytest
 
 import dask_awkward as dak
+from dask_awkward.lib.structure import _WithFieldFn
 from dask_awkward.lib.testutils import AK_LTE_2_5_0, assert_eq
 from dask_awkward.utils import DaskAwkwardNotImplemented
 
@@ -147,6 +148,34 @@ def test_fill_none(vf: int | float | str, axis: int | None) -> None:
     assert_eq(d, e, check_forms=(not isinstance(vf, str)))
 
 
+def _flat_option_layouts() -> list[ak.contents.Content]:
+    data = ak.contents.NumpyArray(np.array([1, 2, 3, 4, 5, 6], dtype=np.int32))
+    mask = np.array([True, False, True, True, False, True])
+    return [
+        ak.contents.ByteMaskedArray(ak.index.Index8(mask), data, valid_when=True),
+        ak.contents.BitMaskedArray(
+            ak.index.IndexU8(np.packbits(mask, bitorder="little")),
+            data,
+            valid_when=True,
+            length=len(mask),
+            lsb_order=True,
+        ),
+        ak.contents.IndexedOptionArray(
+            ak.index.Index64(np.array([0, -1, 2, 3, -1, 5])), data
+        ),
+        ak.contents.UnmaskedArray(data),
+    ]
+
+
+@pytest.mark.parametrize("layout", _flat_option_layouts())
+@pytest.mark.parametrize("value", [0, 1.5, True, np.int8(-1)])
+def test_fill_none_is_none_flat(layout: ak.contents.Content, value: Any) -> None:
+    caa = ak.Array(layout)
+    daa = dak.from_awkward(caa, npartitions=2)
+    assert_eq(dak.fill_none(daa, value), ak.fill_none(caa, value))
+    assert_eq(dak.is_none(daa), ak.is_none(caa))
+
+
 @pytest.mark.parametrize("axis", [None, 0, 1, -1])
 def test_drop_none(axis: int) -> None:
     a = [[1, 2, None], [], [None], [5, 6, 7, None], [1, 2], None]
@@ -211,6 +240,24 @@ def test_pad_none(axis: int, target: int) -> None:
     )
 
 
+@pytest.mark.parametrize("where", ["z", "x", ["z"]])
+def test_with_field_top_level_records(where: str | list[str]) -> None:
+    base = ak.Array(
+        [{"x": 1, "y": [1, 2]}, {"x": 2, "y": []}, {"x": 3, "y": [3]}],
+        with_name="Point",
+    )
+    whats = [ak.Array([1.5, None, 2.5]), ak.Array([[1], [], [2, 3]])]
+    dbase = dak.from_awkward(base, npartitions=2)
+    for what in whats:
+        dwhat = dak.from_awkward(what, npartitions=2)
+        expected = ak.with_field(base, what, where=where)
+        assert_eq(dak.with_field(dbase, dwhat, where=where), expected)
+
+    # the new field is added without touching the layout of `what`.
+    fn = _WithFieldFn(where=where, highlevel=True, behavior=None, attrs=None)
+    assert fn(base, whats[0]).layout.contents[-1] is whats[0].layout
+
+
 def test_with_field(caa: ak.Array, daa: dak.Array) -> None:
     new_caa = ak.with_field(caa["points"], caa["points"]["x"], where="xx")
     new_daa = dak.with_field(daa["points"], daa["points"]["x"], where="xx")
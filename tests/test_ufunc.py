@@ -35,3 +35,11 @@ def test_ufunc_method_raise(daa: dak.Array, f: Callable) -> None:
     daa = daa.points.x
     with pytest.raises(RuntimeError, match="Array ufunc supports only method"):
         f(daa, daa)
+
+
+def test_ufunc_names(daa: dak.Array, caa: ak.Array) -> None:
+    x = daa.points.x
+    assert np.add(x, 1).name == np.add(x, 1).name
+    assert np.add(x, 1).name != np.subtract(x, 1).name
+    assert np.add(x, 1).name != np.add(x, 2).name
+    assert_eq(np.add(x, 1), caa.points.x + 1)